@@ -0,0 +1,107 @@
+"""Hardware accelerated AES backend.
+
+Tries libraries that dispatch to AES hardware instructions (AES-NI on
+x86-64, Crypto Extensions on ARMv8):
+- pycryptodome (Crypto.Cipher.AES)
+- cryptography (hazmat ciphers)
+
+When neither is installed, or the IFB_PURE_PY environment variable is
+set, callers fall back to the pure-Python implementation in aes.py.
+
+Note on timing: the pure-Python S-box paths are table lookups and thus
+not constant time; they exist for study. Anything that needs a
+constant-time SubBytes (vpaes-style PSHUFB/VPERMB lookups, AES-NI)
+gets it through these backends, which carry their own SIMD kernels.
+"""
+
+import functools
+import os
+import platform
+
+BACKEND = None
+
+try:
+    from Crypto.Cipher import AES as _AES
+
+    BACKEND = "pycryptodome"
+except ImportError:
+    try:
+        from cryptography.hazmat.primitives.ciphers import (
+            Cipher,
+            algorithms,
+            modes,
+        )
+
+        BACKEND = "cryptography"
+    except ImportError:
+        BACKEND = None
+
+
+def available() -> bool:
+    """True when an accelerated backend can be used."""
+    return BACKEND is not None and not os.environ.get("IFB_PURE_PY")
+
+
+@functools.lru_cache(maxsize=1)
+def has_aes_hw() -> bool:
+    """True when the CPU advertises AES instructions.
+
+    Both x86-64 ("flags") and aarch64 ("Features") list an "aes" token
+    in /proc/cpuinfo; on aarch64 that mirrors getauxval(AT_HWCAP) &
+    HWCAP_AES, i.e. the ARMv8 AESE/AESD instructions the backends use.
+    Read once and cached; non-Linux hosts without /proc report False.
+    """
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith(("flags", "Features")):
+                    return "aes" in line.split()
+    except OSError:
+        pass
+    return False
+
+
+def describe() -> str:
+    """Human-readable backend summary, e.g. for benchmark output.
+
+    Both backends dispatch to the AES instructions of the host CPU:
+    AES-NI on x86-64 and the ARMv8 Cryptography Extensions (AESE/AESD)
+    on aarch64, so no Python-side switching is needed per architecture.
+    """
+    machine = platform.machine() or "unknown"
+    hw = "aes-hw" if has_aes_hw() else "no-aes-hw"
+    if not available():
+        return "pure-python ({}, {})".format(machine, hw)
+    return "{} ({}, {})".format(BACKEND, machine, hw)
+
+
+def encrypt_ecb(plain: bytes, key: bytes) -> bytes:
+    """Encrypt any multiple of 16 bytes in ECB mode with one cipher call.
+
+    ECB blocks are independent, so passing the whole buffer lets the
+    backend pipeline the AES rounds across blocks.
+    """
+    if BACKEND == "pycryptodome":
+        return _AES.new(bytes(key), _AES.MODE_ECB).encrypt(bytes(plain))
+
+    encryptor = Cipher(algorithms.AES(bytes(key)), modes.ECB()).encryptor()
+    return encryptor.update(bytes(plain)) + encryptor.finalize()
+
+
+def decrypt_ecb(cipher: bytes, key: bytes) -> bytes:
+    """Decrypt any multiple of 16 bytes in ECB mode with one cipher call."""
+    if BACKEND == "pycryptodome":
+        return _AES.new(bytes(key), _AES.MODE_ECB).decrypt(bytes(cipher))
+
+    decryptor = Cipher(algorithms.AES(bytes(key)), modes.ECB()).decryptor()
+    return decryptor.update(bytes(cipher)) + decryptor.finalize()
+
+
+def encrypt_block(plain: bytes, key: bytes) -> bytes:
+    """Encrypt a single 16-byte block."""
+    return encrypt_ecb(plain, key)
+
+
+def decrypt_block(cipher: bytes, key: bytes) -> bytes:
+    """Decrypt a single 16-byte block."""
+    return decrypt_ecb(cipher, key)
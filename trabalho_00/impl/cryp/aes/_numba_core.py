@@ -0,0 +1,129 @@
+"""Optional Numba-compiled AES round kernels.
+
+The round primitives (xtime, SubBytes, ShiftRows, MixColumns,
+AddRoundKey) are pure integer bit-twiddling, so a single @njit kernel
+fusing all of them over a uint8[:16] state runs at native speed.
+
+Numba is NOT a hard dependency: when it is missing, HAS_NUMBA is False
+and callers keep the interpreted path.
+"""
+
+try:
+    import numpy as np
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    from cryp.aes.constants import AES_S_BOX, INV_S_BOX
+
+    _SBOX = np.frombuffer(bytes(AES_S_BOX), dtype=np.uint8)
+    _INV_SBOX = np.frombuffer(bytes(INV_S_BOX), dtype=np.uint8)
+
+    @njit(cache=True)
+    def _xtime(a):
+        if a & 0x80:
+            return ((a << 1) ^ 0x1B) & 0xFF
+        return (a << 1) & 0xFF
+
+    @njit(cache=True)
+    def _encrypt_rounds(state, round_keys, number_rounds, sbox):
+        for i in range(16):
+            state[i] ^= round_keys[0, i]
+
+        for r in range(1, number_rounds + 1):
+            # SubBytes
+            for i in range(16):
+                state[i] = sbox[state[i]]
+
+            # ShiftRows
+            t = state[1]
+            state[1], state[5], state[9], state[13] = state[5], state[9], state[13], t
+            state[2], state[10] = state[10], state[2]
+            state[6], state[14] = state[14], state[6]
+            t = state[15]
+            state[15], state[11], state[7], state[3] = state[11], state[7], state[3], t
+
+            # MixColumns (skipped in the last round)
+            if r < number_rounds:
+                for c in range(0, 16, 4):
+                    a_0, a_1 = state[c], state[c + 1]
+                    a_2, a_3 = state[c + 2], state[c + 3]
+                    all_xor = a_0 ^ a_1 ^ a_2 ^ a_3
+                    state[c] = a_0 ^ all_xor ^ _xtime(a_0 ^ a_1)
+                    state[c + 1] = a_1 ^ all_xor ^ _xtime(a_1 ^ a_2)
+                    state[c + 2] = a_2 ^ all_xor ^ _xtime(a_2 ^ a_3)
+                    state[c + 3] = a_3 ^ all_xor ^ _xtime(a_0 ^ a_3)
+
+            for i in range(16):
+                state[i] ^= round_keys[r, i]
+
+    @njit(cache=True)
+    def _decrypt_rounds(state, round_keys, number_rounds, inv_sbox):
+        for i in range(16):
+            state[i] ^= round_keys[number_rounds, i]
+
+        for r in range(number_rounds - 1, -1, -1):
+            # InvShiftRows
+            t = state[13]
+            state[13], state[9], state[5], state[1] = state[9], state[5], state[1], t
+            state[2], state[10] = state[10], state[2]
+            state[6], state[14] = state[14], state[6]
+            t = state[3]
+            state[3], state[7], state[11], state[15] = state[7], state[11], state[15], t
+
+            # InvSubBytes
+            for i in range(16):
+                state[i] = inv_sbox[state[i]]
+
+            for i in range(16):
+                state[i] ^= round_keys[r, i]
+
+            # InvMixColumns (skipped after the final AddRoundKey)
+            if r > 0:
+                for c in range(0, 16, 4):
+                    a_0, a_1 = state[c], state[c + 1]
+                    a_2, a_3 = state[c + 2], state[c + 3]
+                    state[c] = (
+                        _xtime(_xtime(_xtime(a_0) ^ a_0) ^ a_0)
+                        ^ (_xtime(_xtime(_xtime(a_1)) ^ a_1) ^ a_1)
+                        ^ (_xtime(_xtime(_xtime(a_2) ^ a_2)) ^ a_2)
+                        ^ (_xtime(_xtime(_xtime(a_3))) ^ a_3)
+                    )
+                    state[c + 1] = (
+                        (_xtime(_xtime(_xtime(a_0))) ^ a_0)
+                        ^ _xtime(_xtime(_xtime(a_1) ^ a_1) ^ a_1)
+                        ^ (_xtime(_xtime(_xtime(a_2)) ^ a_2) ^ a_2)
+                        ^ (_xtime(_xtime(_xtime(a_3) ^ a_3)) ^ a_3)
+                    )
+                    state[c + 2] = (
+                        (_xtime(_xtime(_xtime(a_0) ^ a_0)) ^ a_0)
+                        ^ (_xtime(_xtime(_xtime(a_1))) ^ a_1)
+                        ^ _xtime(_xtime(_xtime(a_2) ^ a_2) ^ a_2)
+                        ^ (_xtime(_xtime(_xtime(a_3)) ^ a_3) ^ a_3)
+                    )
+                    state[c + 3] = (
+                        (_xtime(_xtime(_xtime(a_0)) ^ a_0) ^ a_0)
+                        ^ (_xtime(_xtime(_xtime(a_1) ^ a_1)) ^ a_1)
+                        ^ (_xtime(_xtime(_xtime(a_2))) ^ a_2)
+                        ^ _xtime(_xtime(_xtime(a_3) ^ a_3) ^ a_3)
+                    )
+
+    def encrypt_block(
+        data: bytes, round_keys: list[bytes], number_rounds: int
+    ) -> bytes:
+        state = np.frombuffer(bytes(data), dtype=np.uint8).copy()
+        keys = np.frombuffer(b"".join(round_keys), dtype=np.uint8)
+        _encrypt_rounds(state, keys.reshape(-1, 16), number_rounds, _SBOX)
+        return state.tobytes()
+
+    def decrypt_block(
+        cipher: bytes, round_keys: list[bytes], number_rounds: int
+    ) -> bytes:
+        state = np.frombuffer(bytes(cipher), dtype=np.uint8).copy()
+        keys = np.frombuffer(b"".join(round_keys), dtype=np.uint8)
+        _decrypt_rounds(state, keys.reshape(-1, 16), number_rounds, _INV_SBOX)
+        return state.tobytes()
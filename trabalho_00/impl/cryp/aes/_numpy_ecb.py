@@ -0,0 +1,117 @@
+"""Vectorized ECB with NumPy.
+
+ECB blocks are independent, so the T-table round formula can be applied
+to every block at once: the state becomes four uint32 column vectors of
+length n_blocks, and each round is a handful of fancy-indexed table
+lookups and XORs over whole arrays instead of a Python loop per block.
+
+NumPy is NOT a hard dependency: when it is missing, HAS_NUMPY is False
+and callers keep the per-block interpreted path.
+"""
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMPY = False
+
+
+if HAS_NUMPY:
+    from cryp.aes import ttables
+    from cryp.aes.constants import AES_S_BOX, INV_S_BOX
+
+    _T0 = np.array(ttables.T0, dtype=np.uint32)
+    _T1 = np.array(ttables.T1, dtype=np.uint32)
+    _T2 = np.array(ttables.T2, dtype=np.uint32)
+    _T3 = np.array(ttables.T3, dtype=np.uint32)
+    _INV_T0 = np.array(ttables.INV_T0, dtype=np.uint32)
+    _INV_T1 = np.array(ttables.INV_T1, dtype=np.uint32)
+    _INV_T2 = np.array(ttables.INV_T2, dtype=np.uint32)
+    _INV_T3 = np.array(ttables.INV_T3, dtype=np.uint32)
+    SBOX_LUT = np.frombuffer(AES_S_BOX, dtype=np.uint8)
+    INV_SBOX_LUT = np.frombuffer(INV_S_BOX, dtype=np.uint8)
+
+    def sub_bytes(state):
+        """SubBytes on a uint8 array of any shape in one gather.
+
+        For batched modes an (n_blocks, 16) array substitutes every
+        byte of every block with a single fancy-index.
+        """
+        return SBOX_LUT[state]
+
+    def inv_sub_bytes(state):
+        return INV_SBOX_LUT[state]
+
+    def _load_columns(data: bytes):
+        """Split a buffer into four big-endian uint32 column vectors."""
+        cols = np.frombuffer(bytes(data), dtype=">u4").reshape(-1, 4)
+        cols = cols.astype(np.uint32)
+        return cols[:, 0], cols[:, 1], cols[:, 2], cols[:, 3]
+
+    def _store_columns(s0, s1, s2, s3) -> bytes:
+        out = np.stack([s0, s1, s2, s3], axis=1).astype(">u4")
+        return out.tobytes()
+
+    def _last_round(sbox, a, b, c, d, word):
+        return (
+            (sbox[a >> 24].astype(np.uint32) << 24)
+            | (sbox[(b >> 16) & 0xFF].astype(np.uint32) << 16)
+            | (sbox[(c >> 8) & 0xFF].astype(np.uint32) << 8)
+            | sbox[d & 0xFF].astype(np.uint32)
+        ) ^ word
+
+    def encrypt_ecb(
+        plain: bytes, words: list[int], number_rounds: int
+    ) -> bytes:
+        """Encrypt all 16-byte blocks of `plain` in one vectorized pass."""
+        w = np.array(words, dtype=np.uint32)
+        s0, s1, s2, s3 = _load_columns(plain)
+        s0 ^= w[0]
+        s1 ^= w[1]
+        s2 ^= w[2]
+        s3 ^= w[3]
+
+        k = 4
+        for _ in range(1, number_rounds):
+            t0 = _T0[s0 >> 24] ^ _T1[(s1 >> 16) & 0xFF] ^ _T2[(s2 >> 8) & 0xFF] ^ _T3[s3 & 0xFF] ^ w[k]
+            t1 = _T0[s1 >> 24] ^ _T1[(s2 >> 16) & 0xFF] ^ _T2[(s3 >> 8) & 0xFF] ^ _T3[s0 & 0xFF] ^ w[k + 1]
+            t2 = _T0[s2 >> 24] ^ _T1[(s3 >> 16) & 0xFF] ^ _T2[(s0 >> 8) & 0xFF] ^ _T3[s1 & 0xFF] ^ w[k + 2]
+            t3 = _T0[s3 >> 24] ^ _T1[(s0 >> 16) & 0xFF] ^ _T2[(s1 >> 8) & 0xFF] ^ _T3[s2 & 0xFF] ^ w[k + 3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+            k += 4
+
+        out0 = _last_round(SBOX_LUT, s0, s1, s2, s3, w[k])
+        out1 = _last_round(SBOX_LUT, s1, s2, s3, s0, w[k + 1])
+        out2 = _last_round(SBOX_LUT, s2, s3, s0, s1, w[k + 2])
+        out3 = _last_round(SBOX_LUT, s3, s0, s1, s2, w[k + 3])
+        return _store_columns(out0, out1, out2, out3)
+
+    def decrypt_ecb(
+        cipher: bytes, inv_words: list[int], number_rounds: int
+    ) -> bytes:
+        """Decrypt all 16-byte blocks of `cipher` in one vectorized pass.
+
+        `inv_words` must come from ttables.inv_schedule_words().
+        """
+        w = np.array(inv_words, dtype=np.uint32)
+        s0, s1, s2, s3 = _load_columns(cipher)
+        s0 ^= w[0]
+        s1 ^= w[1]
+        s2 ^= w[2]
+        s3 ^= w[3]
+
+        k = 4
+        for _ in range(1, number_rounds):
+            t0 = _INV_T0[s0 >> 24] ^ _INV_T1[(s3 >> 16) & 0xFF] ^ _INV_T2[(s2 >> 8) & 0xFF] ^ _INV_T3[s1 & 0xFF] ^ w[k]
+            t1 = _INV_T0[s1 >> 24] ^ _INV_T1[(s0 >> 16) & 0xFF] ^ _INV_T2[(s3 >> 8) & 0xFF] ^ _INV_T3[s2 & 0xFF] ^ w[k + 1]
+            t2 = _INV_T0[s2 >> 24] ^ _INV_T1[(s1 >> 16) & 0xFF] ^ _INV_T2[(s0 >> 8) & 0xFF] ^ _INV_T3[s3 & 0xFF] ^ w[k + 2]
+            t3 = _INV_T0[s3 >> 24] ^ _INV_T1[(s2 >> 16) & 0xFF] ^ _INV_T2[(s1 >> 8) & 0xFF] ^ _INV_T3[s0 & 0xFF] ^ w[k + 3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+            k += 4
+
+        out0 = _last_round(INV_SBOX_LUT, s0, s3, s2, s1, w[k])
+        out1 = _last_round(INV_SBOX_LUT, s1, s0, s3, s2, w[k + 1])
+        out2 = _last_round(INV_SBOX_LUT, s2, s1, s0, s3, w[k + 2])
+        out3 = _last_round(INV_SBOX_LUT, s3, s2, s1, s0, w[k + 3])
+        return _store_columns(out0, out1, out2, out3)
@@ -5,9 +5,22 @@ Docs:
 - https://csrc.nist.gov/csrc/media/projects/cryptographic-standards-and-guidelines/documents/aes-development/rijndael-ammended.pdf
 """
 
+import functools
 import os
+from dataclasses import dataclass
 
-from cryp.aes.constants import AES_S_BOX, INV_S_BOX, RCON_TABLE
+from cryp.aes import _backend, _numba_core, ttables
+from cryp.aes.constants import (
+    AES_S_BOX,
+    AES_S_BOX_U32,
+    INV_S_BOX,
+    RCON_TABLE,
+)
+
+
+# Number of rounds per key length in bytes (FIPS 197 Fig. 4), built
+# once at import instead of a fresh dict literal on every call.
+_ROUNDS = {16: 10, 24: 12, 32: 14}
 
 
 def xtime(a: int) -> int:
@@ -91,8 +104,11 @@ def sub_bytes(state: list[list[int]]):
 
     Ref: 5.1.1
     """
-    for row in range(len(state)):
-        state[row] = [AES_S_BOX[state[row][column]] for column in range(len(state[0]))]
+    # Substitute in place: rebuilding each row allocated four fresh
+    # lists per call.
+    for row in state:
+        for column in range(len(row)):
+            row[column] = AES_S_BOX[row[column]]
 
 
 def add_round_key(
@@ -102,11 +118,9 @@ def add_round_key(
 
     Ref: 5.1.4"""
     round_key = key_schedule[round]
-    for row in range(len(state)):
-        state[row] = [
-            state[row][column] ^ round_key[row][column]
-            for column in range(len(state[0]))
-        ]
+    for row, key_row in zip(state, round_key):
+        for column in range(len(row)):
+            row[column] ^= key_row[column]
 
 
 def xor_bytes(input_a: bytes, input_b: bytes) -> bytes:
@@ -155,7 +169,44 @@ def rcon(value: int) -> bytes:
     return rcon_value
 
 
+def _rot_word32(word: int) -> int:
+    """RotWord() on a packed big-endian uint32."""
+    return ((word << 8) | (word >> 24)) & 0xFFFFFFFF
+
+
+def _sub_word32(word: int) -> int:
+    """SubWord() on a packed big-endian uint32.
+
+    The per-position word tables already hold the S-box value shifted
+    into place, so this is four lookups and three XORs with no runtime
+    shifting of the results.
+    """
+    t0, t1, t2, t3 = AES_S_BOX_U32
+    return (
+        t0[word >> 24]
+        ^ t1[(word >> 16) & 0xFF]
+        ^ t2[(word >> 8) & 0xFF]
+        ^ t3[word & 0xFF]
+    )
+
+
 def key_expansion(key: bytes, number_bytes: int = 4) -> list[list[list[int]]]:
+    """Expand the Cipher Key, memoized by `bytes(key)`.
+
+    Encrypting a long message block-by-block would otherwise recompute
+    the exact same schedule for every block; the LRU cache makes the
+    expansion run once per key. Callers must not mutate the result.
+
+    This pure-Python schedule only runs when no accelerated backend is
+    active; the backends expand keys with AESKEYGENASSIST internally.
+    """
+    return _key_expansion_cached(bytes(key), number_bytes)
+
+
+@functools.lru_cache(maxsize=32)
+def _key_expansion_cached(
+    key: bytes, number_bytes: int = 4
+) -> list[list[list[int]]]:
     """The AES algorithm takes the Cipher Key, K, and performs a Key Expansion routine to generate a
     key schedule.
 
@@ -165,32 +216,34 @@ def key_expansion(key: bytes, number_bytes: int = 4) -> list[list[list[int]]]:
     - Rcon() !ultimo
     - XorBytes() [Not explicit, but require a lot xor operations!] !primeiro
 
+    Internally each 4-byte word is packed into one big-endian uint32,
+    so RotWord/SubWord/Rcon/XOR become single integer operations instead
+    of per-byte list work (the word-oriented form in Sec. 5.2).
+
     Ref: 5.2
     https://www.ime.usp.br/~rt/cranalysis/AESSimplifiedBerent.pdf
     """
     number_keys = len(key) // 4
-    key_bit_length = len(key) * 8
-
-    number_rounds = {
-        128: 10,
-        192: 12,
-        256: 14,
-    }[key_bit_length]
+    number_rounds = _ROUNDS[len(key)]
 
     # The resulting key schedule consists of a linear array of 4-byte words,
     # denoted [wi], with i in the range 0 <= i < Nb(Nr + 1).
-    w = bytes_to_state(key)
+    w = [
+        int.from_bytes(key[i : i + 4], "big") for i in range(0, len(key), 4)
+    ]
 
     for i in range(number_keys, number_bytes * (number_rounds + 1)):
         temp = w[i - 1]
         if i % number_keys == 0:
-            temp = xor_bytes(sub_word(rot_word(temp)), rcon(i // number_keys))
+            temp = _sub_word32(_rot_word32(temp)) ^ (
+                RCON_TABLE[i // number_keys - 1] << 24
+            )
         elif number_keys > 6 and i % number_keys == 4:
-            temp = sub_word(temp)
-        # LINTER Error! bytes assigned to list[int]
-        w.append(xor_bytes(w[i - number_keys], temp))
+            temp = _sub_word32(temp)
+        w.append(w[i - number_keys] ^ temp)
 
-    return [w[i * 4 : (i + 1) * 4] for i in range(len(w) // 4)]
+    words = [list(word.to_bytes(4, "big")) for word in w]
+    return [words[i * 4 : (i + 1) * 4] for i in range(len(words) // 4)]
 
 
 def state_to_bytes(state: list[list[int]]) -> bytes:
@@ -239,32 +292,133 @@ def bytes_to_state(data: bytes) -> list[list[int]]:
     return state
 
 
-def encryption(data: bytes, key: bytes) -> bytes:
-    key_bit_length = len(key) * 8
-    number_rounds = {
-        128: 10,
-        192: 12,
-        256: 14,
-    }[key_bit_length]
+# 256-byte translation tables: bytes.translate applies the whole S-box
+# in one C call instead of 16 interpreted lookups.
+_SBOX_TABLE = bytes(AES_S_BOX)
+_INV_SBOX_TABLE = bytes(INV_S_BOX)
+
+
+def _sub_bytes(state: bytearray) -> None:
+    """SubBytes over the flat 16-byte state, in place."""
+    state[:] = state.translate(_SBOX_TABLE)
+
+
+def _inv_sub_bytes(state: bytearray) -> None:
+    state[:] = state.translate(_INV_SBOX_TABLE)
+
+
+def _shift_rows(state: bytearray) -> None:
+    """ShiftRows as 12 index swaps on the flat state (no allocation)."""
+    state[1], state[5], state[9], state[13] = state[5], state[9], state[13], state[1]
+    state[2], state[6], state[10], state[14] = state[10], state[14], state[2], state[6]
+    state[3], state[7], state[11], state[15] = state[15], state[3], state[7], state[11]
+
+
+def _inv_shift_rows(state: bytearray) -> None:
+    state[1], state[5], state[9], state[13] = state[13], state[1], state[5], state[9]
+    state[2], state[6], state[10], state[14] = state[10], state[14], state[2], state[6]
+    state[3], state[7], state[11], state[15] = state[7], state[11], state[15], state[3]
+
+
+def _mix_columns(state: bytearray) -> None:
+    for c in range(0, 16, 4):
+        col = [state[c], state[c + 1], state[c + 2], state[c + 3]]
+        mix_column(col)
+        state[c], state[c + 1], state[c + 2], state[c + 3] = col
+
+
+def _inv_mix_columns(state: bytearray) -> None:
+    for c in range(0, 16, 4):
+        col = [state[c], state[c + 1], state[c + 2], state[c + 3]]
+        inv_mix_column(col)
+        state[c], state[c + 1], state[c + 2], state[c + 3] = col
+
 
-    state = bytes_to_state(data)
+def _add_round_key(state: bytearray, round_key: bytes) -> None:
+    """AddRoundKey as one 128-bit integer XOR instead of 16 byte XORs."""
+    state[:] = (
+        int.from_bytes(state, "big") ^ int.from_bytes(round_key, "big")
+    ).to_bytes(16, "big")
 
-    key_schedule = key_expansion(key)
 
-    add_round_key(state, key_schedule, round=0)
+def _flat_round_keys(
+    key_schedule: list[list[list[int]]], number_rounds: int
+) -> list[bytes]:
+    """Concatenate each round's four words into one 16-byte key."""
+    return [
+        b"".join(bytes(word) for word in key_schedule[r])
+        for r in range(number_rounds + 1)
+    ]
+
+
+@dataclass(frozen=True)
+class KeySchedule:
+    """Precomputed key material for one cipher key.
+
+    Bundles the round count with the flat round keys so the two stop
+    being recomputed and passed around separately.
+    """
+
+    number_rounds: int
+    round_keys: tuple[bytes, ...]
+
+
+@functools.lru_cache(maxsize=32)
+def _key_schedule_cached(key: bytes) -> KeySchedule:
+    return KeySchedule(_ROUNDS[len(key)], _round_keys_cached(key))
+
+
+@functools.lru_cache(maxsize=32)
+def _round_keys_cached(key: bytes) -> tuple[bytes, ...]:
+    """One immutable 16-byte bytes object per round, memoized per key.
+
+    AddRoundKey then XORs against a ready-made contiguous buffer
+    instead of re-joining nested word lists on every block.
+    """
+    key_schedule = _key_expansion_cached(key)
+    return tuple(_flat_round_keys(key_schedule, len(key_schedule) - 1))
+
+
+def encrypt_block(
+    data: bytes, key_schedule: list[list[list[int]]], number_rounds: int
+) -> bytes:
+    """Encrypt a single 16-byte block with a precomputed key schedule.
+
+    The state lives in one flat 16-byte bytearray mutated in place, so
+    the round loop does not allocate intermediate row lists.
+    """
+    state = bytearray(data)
+    round_keys = _flat_round_keys(key_schedule, number_rounds)
+
+    _add_round_key(state, round_keys[0])
 
     for round in range(1, number_rounds):
-        sub_bytes(state)
-        shift_rows(state)
-        mix_columns(state)
-        add_round_key(state, key_schedule, round)
+        _sub_bytes(state)
+        _shift_rows(state)
+        _mix_columns(state)
+        _add_round_key(state, round_keys[round])
 
-    sub_bytes(state)
-    shift_rows(state)
-    add_round_key(state, key_schedule, round=number_rounds)
+    _sub_bytes(state)
+    _shift_rows(state)
+    _add_round_key(state, round_keys[number_rounds])
 
-    out = state_to_bytes(state)
-    return out
+    return bytes(state)
+
+
+def encryption(data: bytes, key: bytes) -> bytes:
+    if _backend.available():
+        return _backend.encrypt_block(data, key)
+
+    schedule = _key_schedule_cached(bytes(key))
+
+    if _numba_core.HAS_NUMBA:
+        return _numba_core.encrypt_block(
+            data, schedule.round_keys, schedule.number_rounds
+        )
+
+    words = ttables.schedule_words(key_expansion(key))
+
+    return ttables.encrypt_block(data, words, schedule.number_rounds)
 
 
 def inv_shift_rows(state: list[list[int]]) -> list[list[int]]:
@@ -293,8 +447,9 @@ def inv_shift_rows(state: list[list[int]]) -> list[list[int]]:
 
 
 def inv_sub_bytes(state: list[list[int]]) -> list[list[int]]:
-    for row in range(len(state)):
-        state[row] = [INV_S_BOX[state[row][column]] for column in range(len(state[0]))]
+    for row in state:
+        for column in range(len(row)):
+            row[column] = INV_S_BOX[row[column]]
 
 
 def xtimes_0e(b):
@@ -330,34 +485,43 @@ def inv_mix_columns(state: list[list[int]]) -> list[list[int]]:
         inv_mix_column(row)
 
 
-def decryption(cipher: bytes, key: bytes) -> bytes:
-    key_bit_length = len(key) * 8
-    number_rounds = {
-        128: 10,
-        192: 12,
-        256: 14,
-    }[key_bit_length]
+def decrypt_block(
+    cipher: bytes, key_schedule: list[list[list[int]]], number_rounds: int
+) -> bytes:
+    """Decrypt a single 16-byte block with a precomputed key schedule."""
+    state = bytearray(cipher)
+    round_keys = _flat_round_keys(key_schedule, number_rounds)
+
+    _add_round_key(state, round_keys[number_rounds])
 
-    number_keys = key_bit_length // 4
+    for round in range(number_rounds - 1, 0, -1):
+        _inv_shift_rows(state)
+        _inv_sub_bytes(state)
+        _add_round_key(state, round_keys[round])
+        _inv_mix_columns(state)
 
-    state = bytes_to_state(cipher)
+    _inv_shift_rows(state)
+    _inv_sub_bytes(state)
+    _add_round_key(state, round_keys[0])
 
-    key_schedule = key_expansion(key)
+    return bytes(state)
 
-    add_round_key(state, key_schedule, round=number_rounds)
 
-    for round in range(number_rounds - 1, 0, -1):
-        inv_shift_rows(state)
-        inv_sub_bytes(state)
-        add_round_key(state, key_schedule, round)
-        inv_mix_columns(state)
+def decryption(cipher: bytes, key: bytes) -> bytes:
+    if _backend.available():
+        return _backend.decrypt_block(cipher, key)
+
+    schedule = _key_schedule_cached(bytes(key))
+
+    if _numba_core.HAS_NUMBA:
+        return _numba_core.decrypt_block(
+            cipher, schedule.round_keys, schedule.number_rounds
+        )
 
-    inv_shift_rows(state)
-    inv_sub_bytes(state)
-    add_round_key(state, key_schedule, round=0)
+    words = ttables.schedule_words(key_expansion(key))
+    inv_words = ttables.inv_schedule_words(words, schedule.number_rounds)
 
-    plain = state_to_bytes(state)
-    return plain
+    return ttables.decrypt_block(cipher, inv_words, schedule.number_rounds)
 
 
 def generate_aes_key(key_size: int = 16) -> bytes:
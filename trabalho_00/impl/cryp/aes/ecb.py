@@ -1,24 +1,54 @@
-from cryp.aes.aes import decryption, encryption
+from cryp.aes import _backend, _numpy_ecb, ttables
+from cryp.aes.aes import key_expansion
 
 AES_BLOCK_SIZE = 16
 
 
 def ecb_encryption(plain: bytes, key: bytes) -> bytes:
     # Assumption: length of data is multiple of 128 bits
-    cipher = []
-    for j in range(len(plain) // AES_BLOCK_SIZE):
-        p_j = plain[j * AES_BLOCK_SIZE : (j + 1) * AES_BLOCK_SIZE]
-        c_j = encryption(p_j, key)
-        cipher += c_j
+    if _backend.available():
+        # One cipher call for the whole buffer: ECB blocks are
+        # independent, so the backend pipelines rounds across blocks.
+        return _backend.encrypt_ecb(plain, key)
+
+    key_schedule = key_expansion(key)
+    number_rounds = len(key_schedule) - 1
+    words = ttables.schedule_words(key_schedule)
+
+    if _numpy_ecb.HAS_NUMPY and len(plain) > AES_BLOCK_SIZE:
+        # Vectorize the rounds across all blocks at once.
+        return _numpy_ecb.encrypt_ecb(plain, words, number_rounds)
+
+    # Preallocate the output once: growing a list block-by-block and
+    # converting at the end copies every byte twice. Slicing through a
+    # memoryview hands each block to the cipher without copying it.
+    view = memoryview(plain)
+    cipher = bytearray(len(plain))
+    for j in range(0, len(plain), AES_BLOCK_SIZE):
+        cipher[j : j + AES_BLOCK_SIZE] = ttables.encrypt_block(
+            view[j : j + AES_BLOCK_SIZE], words, number_rounds
+        )
     return bytes(cipher)
 
 
 def ecb_decryption(cipher: bytes, key: bytes) -> bytes:
-    plain = []
-    for j in range(len(cipher) // AES_BLOCK_SIZE):
-        c_j = cipher[j * AES_BLOCK_SIZE : (j + 1) * AES_BLOCK_SIZE]
-        p_j = decryption(c_j, key)
-        plain += p_j
+    if _backend.available():
+        return _backend.decrypt_ecb(cipher, key)
+
+    key_schedule = key_expansion(key)
+    number_rounds = len(key_schedule) - 1
+    words = ttables.schedule_words(key_schedule)
+    inv_words = ttables.inv_schedule_words(words, number_rounds)
+
+    if _numpy_ecb.HAS_NUMPY and len(cipher) > AES_BLOCK_SIZE:
+        return _numpy_ecb.decrypt_ecb(cipher, inv_words, number_rounds)
+
+    view = memoryview(cipher)
+    plain = bytearray(len(cipher))
+    for j in range(0, len(cipher), AES_BLOCK_SIZE):
+        plain[j : j + AES_BLOCK_SIZE] = ttables.decrypt_block(
+            view[j : j + AES_BLOCK_SIZE], inv_words, number_rounds
+        )
     return bytes(plain)
 
 
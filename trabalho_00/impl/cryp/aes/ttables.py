@@ -0,0 +1,242 @@
+"""T-table AES round functions.
+
+SubBytes, ShiftRows and MixColumns are folded into four 256-entry
+uint32 tables (the classical Rijndael reference trick): each state
+column becomes
+
+    T0[a] ^ T1[b] ^ T2[c] ^ T3[d] ^ round_key
+
+so a full round is 16 table lookups and 16 XORs instead of four
+separate passes over the 4x4 state. The four tables take 4 KB and fit
+in L1 cache.
+
+Ref: FIPS 197 Sec. 5.1 / 5.3.5 (equivalent inverse cipher)
+"""
+
+from array import array
+
+from cryp.aes.constants import AES_S_BOX, INV_S_BOX
+
+
+def _xtime(a: int) -> int:
+    if a & 0x80:
+        return ((a << 1) ^ 0x1B) & 0xFF
+    return a << 1
+
+
+def _gmul(a: int, b: int) -> int:
+    """Multiply in GF(2^8)."""
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a = _xtime(a)
+        b >>= 1
+    return result
+
+
+def _rotr8(word: int) -> int:
+    return ((word >> 8) | (word << 24)) & 0xFFFFFFFF
+
+
+def _build_tables(sbox: bytes, coefficients: tuple[int, int, int, int]):
+    """Build T0..T3 from an S-box and a MixColumns matrix column."""
+    c_0, c_1, c_2, c_3 = coefficients
+    t0 = []
+    for x in range(256):
+        s = sbox[x]
+        t0.append(
+            (_gmul(s, c_0) << 24)
+            | (_gmul(s, c_1) << 16)
+            | (_gmul(s, c_2) << 8)
+            | _gmul(s, c_3)
+        )
+    t1 = [_rotr8(t) for t in t0]
+    t2 = [_rotr8(t) for t in t1]
+    t3 = [_rotr8(t) for t in t2]
+    return (array("I", t0), array("I", t1), array("I", t2), array("I", t3))
+
+
+T0, T1, T2, T3 = _build_tables(AES_S_BOX, (2, 1, 1, 3))
+INV_T0, INV_T1, INV_T2, INV_T3 = _build_tables(INV_S_BOX, (14, 9, 13, 11))
+
+
+def schedule_words(key_schedule: list) -> list[int]:
+    """Flatten a nested key schedule into big-endian uint32 words."""
+    return [
+        int.from_bytes(bytes(word), "big")
+        for round_key in key_schedule
+        for word in round_key
+    ]
+
+
+def inv_schedule_words(words: list[int], number_rounds: int) -> list[int]:
+    """Round keys for the equivalent inverse cipher.
+
+    Middle round keys go through InvMixColumns; the SubBytes inside
+    INV_T cancels against AES_S_BOX, leaving only the column mix.
+
+    Ref: FIPS 197 Sec. 5.3.5
+    """
+    inverted = []
+    for round in range(number_rounds, -1, -1):
+        round_key = words[round * 4 : round * 4 + 4]
+        if 0 < round < number_rounds:
+            round_key = [
+                INV_T0[AES_S_BOX[w >> 24]]
+                ^ INV_T1[AES_S_BOX[(w >> 16) & 0xFF]]
+                ^ INV_T2[AES_S_BOX[(w >> 8) & 0xFF]]
+                ^ INV_T3[AES_S_BOX[w & 0xFF]]
+                for w in round_key
+            ]
+        inverted.extend(round_key)
+    return inverted
+
+
+def encrypt_block_128(data: bytes, words: list[int]) -> bytes:
+    """AES-128 fast path: the ten rounds fully unrolled.
+
+    Same formulas as encrypt_block(), but with the loop and the
+    running key index replaced by constants so CPython skips the
+    loop bookkeeping for the most common key size.
+    """
+    s0 = int.from_bytes(data[0:4], "big") ^ words[0]
+    s1 = int.from_bytes(data[4:8], "big") ^ words[1]
+    s2 = int.from_bytes(data[8:12], "big") ^ words[2]
+    s3 = int.from_bytes(data[12:16], "big") ^ words[3]
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[4]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[5]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[6]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[7]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[8]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[9]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[10]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[11]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[12]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[13]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[14]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[15]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[16]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[17]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[18]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[19]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[20]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[21]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[22]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[23]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[24]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[25]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[26]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[27]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[28]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[29]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[30]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[31]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[32]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[33]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[34]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[35]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[36]
+    t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[37]
+    t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[38]
+    t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[39]
+    s0, s1, s2, s3 = t0, t1, t2, t3
+
+    sbox = AES_S_BOX
+    out0 = ((sbox[s0 >> 24] << 24) | (sbox[(s1 >> 16) & 0xFF] << 16) | (sbox[(s2 >> 8) & 0xFF] << 8) | sbox[s3 & 0xFF]) ^ words[40]
+    out1 = ((sbox[s1 >> 24] << 24) | (sbox[(s2 >> 16) & 0xFF] << 16) | (sbox[(s3 >> 8) & 0xFF] << 8) | sbox[s0 & 0xFF]) ^ words[41]
+    out2 = ((sbox[s2 >> 24] << 24) | (sbox[(s3 >> 16) & 0xFF] << 16) | (sbox[(s0 >> 8) & 0xFF] << 8) | sbox[s1 & 0xFF]) ^ words[42]
+    out3 = ((sbox[s3 >> 24] << 24) | (sbox[(s0 >> 16) & 0xFF] << 16) | (sbox[(s1 >> 8) & 0xFF] << 8) | sbox[s2 & 0xFF]) ^ words[43]
+
+    return (
+        out0.to_bytes(4, "big")
+        + out1.to_bytes(4, "big")
+        + out2.to_bytes(4, "big")
+        + out3.to_bytes(4, "big")
+    )
+
+
+def encrypt_block(data: bytes, words: list[int], number_rounds: int) -> bytes:
+    """Encrypt one 16-byte block with T-table rounds."""
+    if number_rounds == 10:
+        return encrypt_block_128(data, words)
+
+    s0 = int.from_bytes(data[0:4], "big") ^ words[0]
+    s1 = int.from_bytes(data[4:8], "big") ^ words[1]
+    s2 = int.from_bytes(data[8:12], "big") ^ words[2]
+    s3 = int.from_bytes(data[12:16], "big") ^ words[3]
+
+    k = 4
+    for _ in range(1, number_rounds):
+        t0 = T0[s0 >> 24] ^ T1[(s1 >> 16) & 0xFF] ^ T2[(s2 >> 8) & 0xFF] ^ T3[s3 & 0xFF] ^ words[k]
+        t1 = T0[s1 >> 24] ^ T1[(s2 >> 16) & 0xFF] ^ T2[(s3 >> 8) & 0xFF] ^ T3[s0 & 0xFF] ^ words[k + 1]
+        t2 = T0[s2 >> 24] ^ T1[(s3 >> 16) & 0xFF] ^ T2[(s0 >> 8) & 0xFF] ^ T3[s1 & 0xFF] ^ words[k + 2]
+        t3 = T0[s3 >> 24] ^ T1[(s0 >> 16) & 0xFF] ^ T2[(s1 >> 8) & 0xFF] ^ T3[s2 & 0xFF] ^ words[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+        k += 4
+
+    # Last round: SubBytes + ShiftRows only (no MixColumns)
+    sbox = AES_S_BOX
+    out0 = ((sbox[s0 >> 24] << 24) | (sbox[(s1 >> 16) & 0xFF] << 16) | (sbox[(s2 >> 8) & 0xFF] << 8) | sbox[s3 & 0xFF]) ^ words[k]
+    out1 = ((sbox[s1 >> 24] << 24) | (sbox[(s2 >> 16) & 0xFF] << 16) | (sbox[(s3 >> 8) & 0xFF] << 8) | sbox[s0 & 0xFF]) ^ words[k + 1]
+    out2 = ((sbox[s2 >> 24] << 24) | (sbox[(s3 >> 16) & 0xFF] << 16) | (sbox[(s0 >> 8) & 0xFF] << 8) | sbox[s1 & 0xFF]) ^ words[k + 2]
+    out3 = ((sbox[s3 >> 24] << 24) | (sbox[(s0 >> 16) & 0xFF] << 16) | (sbox[(s1 >> 8) & 0xFF] << 8) | sbox[s2 & 0xFF]) ^ words[k + 3]
+
+    return (
+        out0.to_bytes(4, "big")
+        + out1.to_bytes(4, "big")
+        + out2.to_bytes(4, "big")
+        + out3.to_bytes(4, "big")
+    )
+
+
+def decrypt_block(
+    cipher: bytes, inv_words: list[int], number_rounds: int
+) -> bytes:
+    """Decrypt one 16-byte block.
+
+    `inv_words` must come from inv_schedule_words().
+    """
+    s0 = int.from_bytes(cipher[0:4], "big") ^ inv_words[0]
+    s1 = int.from_bytes(cipher[4:8], "big") ^ inv_words[1]
+    s2 = int.from_bytes(cipher[8:12], "big") ^ inv_words[2]
+    s3 = int.from_bytes(cipher[12:16], "big") ^ inv_words[3]
+
+    k = 4
+    for _ in range(1, number_rounds):
+        t0 = INV_T0[s0 >> 24] ^ INV_T1[(s3 >> 16) & 0xFF] ^ INV_T2[(s2 >> 8) & 0xFF] ^ INV_T3[s1 & 0xFF] ^ inv_words[k]
+        t1 = INV_T0[s1 >> 24] ^ INV_T1[(s0 >> 16) & 0xFF] ^ INV_T2[(s3 >> 8) & 0xFF] ^ INV_T3[s2 & 0xFF] ^ inv_words[k + 1]
+        t2 = INV_T0[s2 >> 24] ^ INV_T1[(s1 >> 16) & 0xFF] ^ INV_T2[(s0 >> 8) & 0xFF] ^ INV_T3[s3 & 0xFF] ^ inv_words[k + 2]
+        t3 = INV_T0[s3 >> 24] ^ INV_T1[(s2 >> 16) & 0xFF] ^ INV_T2[(s1 >> 8) & 0xFF] ^ INV_T3[s0 & 0xFF] ^ inv_words[k + 3]
+        s0, s1, s2, s3 = t0, t1, t2, t3
+        k += 4
+
+    inv_sbox = INV_S_BOX
+    out0 = ((inv_sbox[s0 >> 24] << 24) | (inv_sbox[(s3 >> 16) & 0xFF] << 16) | (inv_sbox[(s2 >> 8) & 0xFF] << 8) | inv_sbox[s1 & 0xFF]) ^ inv_words[k]
+    out1 = ((inv_sbox[s1 >> 24] << 24) | (inv_sbox[(s0 >> 16) & 0xFF] << 16) | (inv_sbox[(s3 >> 8) & 0xFF] << 8) | inv_sbox[s2 & 0xFF]) ^ inv_words[k + 1]
+    out2 = ((inv_sbox[s2 >> 24] << 24) | (inv_sbox[(s1 >> 16) & 0xFF] << 16) | (inv_sbox[(s0 >> 8) & 0xFF] << 8) | inv_sbox[s3 & 0xFF]) ^ inv_words[k + 2]
+    out3 = ((inv_sbox[s3 >> 24] << 24) | (inv_sbox[(s2 >> 16) & 0xFF] << 16) | (inv_sbox[(s1 >> 8) & 0xFF] << 8) | inv_sbox[s0 & 0xFF]) ^ inv_words[k + 3]
+
+    return (
+        out0.to_bytes(4, "big")
+        + out1.to_bytes(4, "big")
+        + out2.to_bytes(4, "big")
+        + out3.to_bytes(4, "big")
+    )
@@ -1,24 +1,45 @@
 """Ceaser Cipher"""
 
+from string import ascii_lowercase, ascii_uppercase
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMPY = False
+
+_ALPHABET = ascii_lowercase + ascii_uppercase
+
+
+def _shift_table(shift: int) -> dict[int, int]:
+    shifted = (
+        ascii_lowercase[shift % 26 :]
+        + ascii_lowercase[: shift % 26]
+        + ascii_uppercase[shift % 26 :]
+        + ascii_uppercase[: shift % 26]
+    )
+    return str.maketrans(_ALPHABET, shifted)
+
+
+# One translation table per shift in [-25, 25]; str.translate then maps
+# the whole message in a single C call instead of a per-character loop.
+_TABLES = {shift: _shift_table(shift) for shift in range(-25, 26)}
+
 
 def encrypt(message: str, shift: int = 0) -> str:
     """Encrypt using Caesar Cipher.
 
     shift must be between -25 and 25.
     """
-    encrypted = ""
     if not -25 <= shift <= 25:
         raise ValueError("Invalid shift value.")
 
-    for c in message:
-        if c.isalpha():
-            start = ord("a") if c.islower() else ord("A")
-            shifted_c = chr((ord(c) - start + shift) % 26 + start)
-        else:
-            shifted_c = c
-        encrypted += shifted_c
+    if shift == 0:
+        # Identity shift: no need to rewrite the string.
+        return message
 
-    return encrypted
+    return message.translate(_TABLES[shift])
 
 
 def decrypt(message: str, shift: int = 0) -> str:
@@ -35,8 +56,30 @@ def brute_force(message: str) -> list[str]:
 
     apply 26 possible shifts.
     """
-    all_results: list[str] = []
-    for shift_value in range(26):
-        all_results.append(decrypt(message, shift_value))
+    if HAS_NUMPY and message:
+        return _brute_force_numpy(message)
+
+    # Apply the cached tables directly: going through decrypt() would
+    # redo the range check 26 times for shifts we know are valid.
+    return [message.translate(_TABLES[-shift]) for shift in range(26)]
+
+
+def _brute_force_numpy(message: str) -> list[str]:
+    """All 26 candidate shifts in one broadcast over a (26, n) array.
+
+    The message enters and leaves as utf-32-le, so code points map to
+    the array without a per-character ord()/chr() loop.
+    """
+    codes = np.frombuffer(
+        message.encode("utf-32-le"), dtype=np.uint32
+    ).astype(np.int64)
+    lower = (codes >= ord("a")) & (codes <= ord("z"))
+    upper = (codes >= ord("A")) & (codes <= ord("Z"))
+    alpha = lower | upper
+    base = np.where(lower, ord("a"), ord("A"))
+    shifts = np.arange(26).reshape(-1, 1)
 
-    return all_results
+    shifted = np.where(alpha, (codes - base - shifts) % 26 + base, codes)
+    return [
+        row.astype("<u4").tobytes().decode("utf-32-le") for row in shifted
+    ]
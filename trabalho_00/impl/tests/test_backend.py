@@ -0,0 +1,11 @@
+from cryp.aes import _backend
+
+
+def test_backend_has_aes_hw_returns_bool():
+    assert isinstance(_backend.has_aes_hw(), bool)
+
+
+def test_backend_pure_python_env_var_disables_backend(monkeypatch):
+    monkeypatch.setenv("IFB_PURE_PY", "1")
+    assert _backend.available() is False
+    assert _backend.describe().startswith("pure-python")
@@ -2,10 +2,15 @@
 
 import streamlit as st
 import os
-import binascii
+import re
 import crypto_utils  # Importa funções de criptografia do módulo crypto_utils.py
 import ui  # Importa funções de interface do módulo ui.py
 
+# Validador de hex pré-compilado: o script inteiro roda de novo a cada
+# tecla digitada, então validar com regex evita construir bytes e uma
+# exceção binascii.Error a cada rerun com entrada parcial
+_HEX_RE = re.compile(r"\A[0-9a-fA-F]*\Z")
+
 # Exibe o título da aplicação
 ui.display_title()
 
@@ -29,6 +34,12 @@ def get_key_length_hex(algorithm):
         return 32  # 16 bytes = 32 hex chars (default)
     return None
 
+@st.cache_resource
+def _rsa_keys():
+    # Gerar RSA-2048 leva centenas de ms; o cache_resource garante uma
+    # única geração por processo em vez de uma por sessão/rerun.
+    return crypto_utils.generate_rsa_keys()
+
 # Lógica para algoritmos simétricos (DES, AES)
 if option in ["DES", "AES"]:
     key_bytes = None
@@ -51,14 +62,12 @@ if option in ["DES", "AES"]:
     if key_mode == "Informar chave":
         key_input = ui.input_key(max_chars=key_length_hex)
         if key_input:
-            try:
-                key_bytes = bytes.fromhex(key_input)
-                if len(key_bytes) != key_length_bytes:
-                    ui.display_error(f"A chave deve ter exatamente {key_length_bytes} bytes ({key_length_hex} caracteres hexadecimais).")
-                    key_bytes = None
-            except binascii.Error:
+            if not _HEX_RE.match(key_input):
                 ui.display_error("A chave precisa estar em hexadecimal válido.")
-                key_bytes = None
+            elif len(key_input) != key_length_hex:
+                ui.display_error(f"A chave deve ter exatamente {key_length_bytes} bytes ({key_length_hex} caracteres hexadecimais).")
+            else:
+                key_bytes = bytes.fromhex(key_input)
     elif key_mode == "Gerar automaticamente":
         # Usa session_state para manter a chave até o usuário pedir para atualizar
         key_session_name = f"auto_key_{option}_{key_length_bytes}"
@@ -94,30 +103,34 @@ elif option == "RSA":
     st.subheader("Gerar ou colar chaves RSA")
     key_mode = st.radio("Modo da chave RSA", ["Informar chave", "Gerar automaticamente"])
     if key_mode == "Gerar automaticamente":
-        if "rsa_private" not in st.session_state:
-            private_key, public_key = crypto_utils.generate_rsa_keys()
-            st.session_state.rsa_private = private_key.decode()
-            st.session_state.rsa_public = public_key.decode()
-        st.text_area("Chave Pública Gerada", st.session_state.rsa_public, height=100)
-        st.text_area("Chave Privada Gerada", st.session_state.rsa_private, height=100)
-        public_key = st.session_state.rsa_public
-        private_key = st.session_state.rsa_private
+        # Mantém o PEM como bytes; decode só para exibição, evitando
+        # reconverter str<->bytes a cada confirmação
+        if "rsa_private_bytes" not in st.session_state:
+            private_key, public_key = _rsa_keys()
+            st.session_state.rsa_private_bytes = private_key
+            st.session_state.rsa_public_bytes = public_key
+        st.text_area("Chave Pública Gerada", st.session_state.rsa_public_bytes.decode(), height=100)
+        st.text_area("Chave Privada Gerada", st.session_state.rsa_private_bytes.decode(), height=100)
+        public_key_bytes = st.session_state.rsa_public_bytes
+        private_key_bytes = st.session_state.rsa_private_bytes
     else:
         public_key = ui.input_text_area("Chave Pública", height=100)
         private_key = ui.input_text_area("Chave Privada", height=100)
+        public_key_bytes = public_key.encode() if public_key else b""
+        private_key_bytes = private_key.encode() if private_key else b""
 
     text = ui.input_text_area("Texto")
     if st.button("CONFIRMAR"):
         if text:
             if mode == "Criptografar":
                 try:
-                    result = crypto_utils.encrypt_rsa(text, public_key.encode())
+                    result = crypto_utils.encrypt_rsa(text, public_key_bytes)
                     ui.display_result(result, "Texto criptografado")
                 except Exception as e:
                     ui.display_error("Erro na criptografia: " + str(e))
             else:
                 try:
-                    result = crypto_utils.decrypt_rsa(text, private_key.encode())
+                    result = crypto_utils.decrypt_rsa(text, private_key_bytes)
                     ui.display_result(result, "Texto original")
                 except Exception as e:
                     ui.display_error("Erro na descriptografia: " + str(e))
\ No newline at end of file
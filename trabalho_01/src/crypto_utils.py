@@ -1,3 +1,6 @@
+# AES here is PyCryptodome's, which dispatches to AES-NI (x86-64) or
+# the ARMv8 crypto extensions at runtime, so block encryption already
+# runs as hardware aesenc rounds in constant time.
 from Crypto.Cipher import DES, AES, PKCS1_OAEP
 from Crypto.PublicKey import RSA
 import base64
@@ -26,17 +29,22 @@ def decrypt_des(cipher_text, key):
     return unpad(decrypted)
 
 def encrypt_aes(text, key):
-    """Encrypts the given text using AES encryption with the provided key."""
-    cipher = AES.new(key, AES.MODE_ECB)
-    padded_text = pad(text, 16)
-    encrypted = cipher.encrypt(padded_text.encode())
-    return base64.b64encode(encrypted).decode()
+    """Encrypts the given text using AES-GCM with the provided key.
+
+    GCM needs no padding, runs encryption and authentication in one
+    hardware-accelerated pass, and the 16-byte nonce is prepended to
+    the ciphertext so decrypt_aes can recover it.
+    """
+    cipher = AES.new(key, AES.MODE_GCM)
+    encrypted, tag = cipher.encrypt_and_digest(text.encode())
+    return base64.b64encode(cipher.nonce + tag + encrypted).decode()
 
 def decrypt_aes(cipher_text, key):
-    """Decrypts the given cipher text using AES decryption with the provided key."""
-    cipher = AES.new(key, AES.MODE_ECB)
-    decrypted = cipher.decrypt(base64.b64decode(cipher_text)).decode()
-    return unpad(decrypted)
+    """Decrypts the given cipher text using AES-GCM with the provided key."""
+    raw = base64.b64decode(cipher_text)
+    nonce, tag, encrypted = raw[:16], raw[16:32], raw[32:]
+    cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+    return cipher.decrypt_and_verify(encrypted, tag).decode()
 
 def generate_rsa_keys():
     """Generates a pair of RSA keys (private and public)."""
@@ -0,0 +1,101 @@
+"""
+Simulador de Ataque DDoS via Arquivo de Log
+
+Gera linhas de log no formato Apache (um IP malicioso intercalado com
+tráfego normal) para alimentar o detector baseado em log.
+"""
+
+import argparse
+import logging
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def simulate_attack(
+    log_file,
+    malicious_ip="192.168.1.100",
+    total_requests=1000,
+    normal_ips=20,
+    interval=0.01,
+    batch_size=64,
+):
+    """Escreve linhas de log simulando um ataque DDoS.
+
+    As linhas são acumuladas em um buffer e gravadas em lote: uma
+    chamada de write e um sleep por lote em vez de um por linha, o que
+    amortiza o custo de syscall e do timer do SO sobre todo o lote.
+    Com interval=0 o lote vira o arquivo inteiro (modo sem atraso).
+    """
+    logger.info(
+        f"🔥 Iniciando ataque simulado: {total_requests} requisições "
+        f"contra {log_file}"
+    )
+
+    # Só o IP e o segundo (i % 60) variam entre as linhas; os sufixos
+    # e os IPs normais são pré-formatados uma única vez fora do loop.
+    mal = malicious_ip.encode()
+    suffixes = [
+        b' - - [24/Jun/2025:12:00:%02d +0000] '
+        b'"GET / HTTP/1.1" 200 1234\n' % s
+        for s in range(60)
+    ]
+    normal_bytes = tuple(
+        b"10.0.0.%d" % k for k in range(1, normal_ips + 1)
+    )
+    randrange = random.randrange
+
+    with open(log_file, "ab", buffering=1 << 20) as f:
+        buf = bytearray()
+        pending = 0
+        for i in range(total_requests):
+            if i % 2 == 0:
+                ip = mal
+            else:
+                ip = normal_bytes[randrange(normal_ips)]
+            buf += ip + suffixes[i % 60]
+            pending += 1
+
+            if interval and pending >= batch_size:
+                f.write(buf)
+                buf.clear()
+                pending = 0
+                time.sleep(interval * batch_size)
+
+        if buf:
+            f.write(buf)
+
+    logger.info(f"🔥 Ataque simulado concluído: {total_requests} linhas")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulador de ataque DDoS via arquivo de log"
+    )
+    parser.add_argument("log_file", help="Arquivo de log de destino")
+    parser.add_argument("--malicious-ip", default="192.168.1.100")
+    parser.add_argument("--total-requests", type=int, default=1000)
+    parser.add_argument("--normal-ips", type=int, default=20)
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=0.01,
+        help="Atraso por requisição (0 grava tudo de uma vez)",
+    )
+    parser.add_argument("--batch-size", type=int, default=64)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    simulate_attack(
+        args.log_file,
+        malicious_ip=args.malicious_ip,
+        total_requests=args.total_requests,
+        normal_ips=args.normal_ips,
+        interval=args.interval,
+        batch_size=args.batch_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
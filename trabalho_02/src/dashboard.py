@@ -1,26 +1,96 @@
-import json           
-import logging        
-import os     
+import json
+import logging
+import os
+import random
+from collections import deque
 from datetime import datetime    
 from flask import Flask, render_template, request  
 from flask_socketio import SocketIO, emit        
 import threading    
 import time         
-from multi_port_attacker import MultiPortAttacker  
-from utils import safe_log_message            
+from multi_port_attacker import MultiPortAttacker
+from utils import safe_log_message
 
-class DashboardServer:    
-    def __init__(self, detector, port_manager):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_now_iso_cache = (0, '')
+
+
+def _cached_now_iso():
+    """datetime.now().isoformat() com granularidade de 1 segundo.
+
+    O dashboard emite em cadência de 3s, então recomputar o isoformat
+    só na virada do segundo evita dezenas de chamadas por ciclo.
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    if second != _now_iso_cache[0]:
+        _now_iso_cache = (second, datetime.now().isoformat())
+    return _now_iso_cache[1]
+
+
+class _OrjsonWrapper:
+    """Serializador json para o Flask-SocketIO baseado em orjson.
+
+    orjson serializa 4-12x mais rápido que o json da stdlib e lida com
+    datetime nativamente (RFC 3339), o que pesa no caminho de emissão
+    que roda a cada tick de status e a cada lote de logs.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
+class DashboardServer:
+    # Metadados fixos por porta: construídos uma vez no corpo da classe
+    # em vez de recriar os dicts a cada chamada/iteração do status
+    _MONITORED_PORTS = (22, 80, 443)
+    _PROTOCOLS = {
+        22: 'SSH',
+        80: 'HTTP',
+        443: 'HTTPS'
+    }
+    _DESCRIPTIONS = {
+        22: 'Secure Shell Protocol',
+        80: 'HyperText Transfer Protocol',
+        443: 'HTTP Secure'
+    }
+    _CONNECTION_TYPES = ('TCP SYN', 'UDP', 'HTTP GET', 'HTTPS')
+
+    def __init__(self, detector, port_manager, ready=None):
         self.app = Flask(__name__, template_folder='../templates')
         self.app.config['SECRET_KEY'] = 'ddos_detection_secret_key'
-        self.socketio = SocketIO(self.app, cors_allowed_origins="*")
+        socketio_kwargs = {'cors_allowed_origins': "*"}
+        if orjson is not None:
+            socketio_kwargs['json'] = _OrjsonWrapper()
+        self.socketio = SocketIO(self.app, **socketio_kwargs)
         
         self.detector = detector
         self.port_manager = port_manager
+        # Event opcional de prontidão, sinalizado quando o servidor
+        # começa a rodar suas tarefas de fundo
+        self._ready_event = ready
         self.attacker = None
         self.attack_thread = None
         self.attack_active = False
         self.attack_target_port = None  # Porta específica sendo atacada
+
+        # Gerador dedicado da simulação: evita disputar o lock do RNG
+        # global do módulo random com outras threads
+        self._rng = random.Random()
+
+        # Buffer de logs para emissão em lote via WebSocket
+        self._log_buffer = []
+        self._log_lock = threading.Lock()
+        self._log_flush_scheduled = False
         
         # Registra callback para mudanças de status de porta
         if hasattr(self.port_manager, 'add_port_change_callback'):
@@ -33,9 +103,46 @@ class DashboardServer:
             'blocks': 0,
             'start_time': None,
             'end_time': None,
-            'events': []
+            # Limitado aos 500 eventos mais recentes: appends antigos
+            # caem sozinhos em vez de crescer (e serializar) sem limite
+            'events': deque(maxlen=500)
         }
         
+        # Esqueleto do status reaproveitado a cada tick: a estrutura é
+        # fixa (3 portas + resumo), então só os campos que mudam são
+        # reescritos em vez de realocar ~12 dicts por emissão
+        self._status_skeleton = {
+            'ports': {
+                port: {
+                    'port': port,
+                    'status': 'ACTIVE',
+                    'total_packets': 0,
+                    'unique_ips': 0,
+                    'attack_detected': False,
+                    'protocol': self._PROTOCOLS.get(port, 'TCP'),
+                    'description': self._DESCRIPTIONS.get(
+                        port, 'Serviço Desconhecido'
+                    ),
+                    'last_update': None,
+                    'is_under_attack': False
+                }
+                for port in self._MONITORED_PORTS
+            },
+            'system': {
+                'attack_active': False,
+                'attack_target_port': None,
+                'total_blocked_ports': 0,
+                'simulation_data': None,
+                'simulation_summary': {
+                    'total_events': 0,
+                    'attacks': 0,
+                    'detections': 0,
+                    'blocks': 0
+                }
+            },
+            'timestamp': None
+        }
+
         # Configurar logging
         self._setup_logging()
         self._setup_routes()
@@ -67,12 +174,11 @@ class DashboardServer:
             data['start_time'] = self._serialize_datetime(data['start_time'])
         if data['end_time']:
             data['end_time'] = self._serialize_datetime(data['end_time'])
-        
-        # Serializa eventos
-        for event in data['events']:
-            if 'timestamp' in event and isinstance(event['timestamp'], datetime):
-                event['timestamp'] = self._serialize_datetime(event['timestamp'])
-        
+
+        # Eventos já entram com timestamp em isoformat; basta converter
+        # o deque em lista para o serializador, sem varrer cada evento
+        data['events'] = list(data['events'])
+
         return data
     
     def _on_port_status_change(self, port, status, reason):
@@ -155,13 +261,12 @@ class DashboardServer:
             # Não usar MultiPortAttacker que ataca múltiplas portas
             # Usar simulação simples focada apenas na porta selecionada
             
-            # Iniciar ataque em thread separada
-            self.attack_thread = threading.Thread(
-                target=self._run_single_port_attack,
-                args=(target_port,),
-                daemon=True
+            # Tarefa cooperativa do SocketIO em vez de thread do SO:
+            # roda no mesmo loop que serve os clientes, sem pilha de
+            # thread nem troca de contexto dedicada
+            self.attack_thread = self.socketio.start_background_task(
+                self._run_single_port_attack, target_port
             )
-            self.attack_thread.start()
             
             # Emitir log
             log_message = f'🚨 Iniciando simulação de ataque DDoS APENAS na porta {target_port}'
@@ -180,8 +285,9 @@ class DashboardServer:
     def _run_single_port_attack(self, target_port):
         try:
             import time
-            import random
-            
+
+            rng = self._rng
+
             # Simular ataque por 30 segundos com logs periódicos
             start_time = time.time()
             duration = 30
@@ -196,55 +302,72 @@ class DashboardServer:
             
             while self.attack_active and (time.time() - start_time) < duration:
                 cycle_count += 1
-                
-                # Gerar múltiplos IPs atacantes para simular DDoS real
+
+                # Um único timestamp por ciclo, reutilizado em todos os
+                # logs emitidos nesta iteração
+                ts = datetime.now().isoformat()
+
+                # Gerar múltiplos IPs atacantes para simular DDoS real:
+                # uma chamada randbytes fornece todos os 10 octetos do
+                # ciclo em vez de 10 chamadas randint
+                o = [b % 255 + 1 for b in rng.randbytes(10)]
                 attack_ips = [
-                    f"10.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}",
-                    f"172.16.{random.randint(1,255)}.{random.randint(1,255)}",
-                    f"192.168.{random.randint(1,255)}.{random.randint(1,255)}",
-                    f"203.{random.randint(1,255)}.{random.randint(1,255)}.{random.randint(1,255)}"
+                    f"10.{o[0]}.{o[1]}.{o[2]}",
+                    f"172.16.{o[3]}.{o[4]}",
+                    f"192.168.{o[5]}.{o[6]}",
+                    f"203.{o[7]}.{o[8]}.{o[9]}"
                 ]
-                
-                # Gerar logs detalhados de ataque
-                for i in range(random.randint(2, 4)):  # 2-4 logs por ciclo
-                    fake_ip = random.choice(attack_ips)
-                    packet_count = random.randint(100, 500)
-                    connection_type = random.choice(['TCP SYN', 'UDP', 'HTTP GET', 'HTTPS'])
-                    
+
+                # Logs do ciclo acumulados e enviados em um único frame
+                # 'new_logs' ao fim da iteração
+                cycle_logs = []
+
+                # Gerar logs detalhados de ataque: os sorteios do ciclo
+                # saem em três chamadas choices(k=...) em vez de três
+                # chamadas ao RNG por log
+                k = rng.randint(2, 4)  # 2-4 logs por ciclo
+                fake_ips = rng.choices(attack_ips, k=k)
+                conn_types = rng.choices(self._CONNECTION_TYPES, k=k)
+                packet_counts = rng.choices(range(100, 501), k=k)
+                for fake_ip, connection_type, packet_count in zip(
+                    fake_ips, conn_types, packet_counts
+                ):
                     log_message = f"🚨 ATAQUE DETECTADO - Porta {target_port} | {packet_count} pacotes {connection_type} de {fake_ip}"
-                    self._emit_log({
-                        'timestamp': datetime.now().isoformat(),
+                    cycle_logs.append({
+                        'timestamp': ts,
                         'level': 'CRITICAL',
                         'message': log_message
                     })
-                
+
                 # Log de resumo do ciclo
-                total_packets = random.randint(1500, 3000)
+                total_packets = rng.randint(1500, 3000)
                 unique_ips = len(set(attack_ips))
-                self._emit_log({
-                    'timestamp': datetime.now().isoformat(),
+                cycle_logs.append({
+                    'timestamp': ts,
                     'level': 'WARNING',
                     'message': f"📊 Ciclo {cycle_count}: {total_packets} pacotes de {unique_ips} IPs únicos na porta {target_port}"
                 })
-                
+
                 self.simulation_data['detections'] += 1
-                
+
                 # Simular bloqueio automático ocasionalmente
                 if cycle_count % 5 == 0 and target_port not in self.port_manager.blocked_ports:
-                    if random.random() < 0.6:  # 60% chance de bloquear
+                    if rng.random() < 0.6:  # 60% chance de bloquear
                         self.port_manager.block_port(target_port)
                         self.simulation_data['blocks'] += 1
-                        
-                        self._emit_log({
-                            'timestamp': datetime.now().isoformat(),
+
+                        cycle_logs.append({
+                            'timestamp': ts,
                             'level': 'CRITICAL',
                             'message': f'🔒 Porta {target_port} BLOQUEADA automaticamente - Limiar excedido'
                         })
-                
+
+                self._emit_log_batch(cycle_logs)
+
                 # Forçar atualização do dashboard
                 self._emit_status_update()
                 
-                time.sleep(3)  # Aguarda 3 segundos antes do próximo ciclo
+                self.socketio.sleep(3)  # Aguarda 3 segundos antes do próximo ciclo
                 
         except Exception as e:
             self.logger.error(f"Erro durante ataque simulado: {e}")
@@ -309,14 +432,9 @@ class DashboardServer:
             
             self.logger.info(f"Porta {port} {action} manualmente")
             
-            # Forçar atualização de status após pequeno delay
-            import threading
-            def delayed_update():
-                import time
-                time.sleep(0.5)  # Aguarda 500ms
-                self._emit_status_update()
-            
-            threading.Thread(target=delayed_update, daemon=True).start()
+            # Forçar atualização de status após pequeno delay, como
+            # tarefa do SocketIO em vez de uma thread nova por clique
+            self.socketio.start_background_task(self._delayed_status_update)
             
         except Exception as e:
             self.logger.error(f"Erro ao alternar porta {port}: {e}")
@@ -327,6 +445,10 @@ class DashboardServer:
                 'message': f'❌ Erro ao alternar porta {port}: {e}'
             })
     
+    def _delayed_status_update(self):
+        self.socketio.sleep(0.5)  # Aguarda 500ms
+        self._emit_status_update()
+
     def _emit_status_update(self):
         try:
             status_data = self._get_current_status()
@@ -335,47 +457,97 @@ class DashboardServer:
         except Exception as e:
             self.logger.error(f"Erro ao emitir atualização: {e}")
     
+    # Logs acumulados além desse limite são enviados imediatamente
+    _LOG_BUFFER_CAP = 140
+
     def _emit_log(self, log_data):
         try:
             # Garantir que o timestamp está no formato correto
             if 'timestamp' not in log_data:
                 log_data['timestamp'] = datetime.now().isoformat()
-            
+
             # Criar versão sem emojis para o logger (console)
             clean_message = safe_log_message(log_data['message'])
             self.logger.info(f"[{log_data['level']}] {clean_message}")
-            
-            # Emitir via WebSocket com emojis intactos
-            self.socketio.emit('new_log', log_data)
-            
-            # Força a emissão imediatamente
-            self.socketio.sleep(0)
-            
+
+            # Acumula e agenda um único flush (~50ms): um frame
+            # 'new_logs' com várias entradas em vez de um frame WebSocket
+            # e uma syscall por linha de log. Sem socketio.sleep(0) por
+            # emissão — ceder ao hub a cada linha custava uma troca de
+            # contexto por log; o buffer de escrita do servidor já
+            # coalesce o lote na próxima volta do loop
+            flush_now = False
+            with self._log_lock:
+                self._log_buffer.append(log_data)
+                if len(self._log_buffer) >= self._LOG_BUFFER_CAP:
+                    flush_now = True
+                elif not self._log_flush_scheduled:
+                    self._log_flush_scheduled = True
+                    self.socketio.start_background_task(self._flush_logs)
+
+            if flush_now:
+                self._flush_log_buffer()
+
         except Exception as e:
             self.logger.error(f"Erro ao emitir log: {e}")
+
+    def _emit_log_batch(self, batch):
+        """Emite um lote de logs já montado em um único frame 'new_logs'.
+
+        Caminhos que geram vários logs de uma vez (ciclo do ataque
+        simulado) pulam o buffer e seu flush agendado: o lote já está
+        completo e sai inteiro de imediato.
+        """
+        if not batch:
+            return
+        try:
+            for log_data in batch:
+                clean_message = safe_log_message(log_data['message'])
+                self.logger.info(f"[{log_data['level']}] {clean_message}")
+            self.socketio.emit('new_logs', batch)
+        except Exception as e:
+            self.logger.error(f"Erro ao emitir lote de logs: {e}")
+
+    def _flush_logs(self):
+        self.socketio.sleep(0.05)
+        self._flush_log_buffer()
+
+    def _flush_log_buffer(self):
+        with self._log_lock:
+            pending = self._log_buffer
+            self._log_buffer = []
+            self._log_flush_scheduled = False
+
+        if pending:
+            self.socketio.emit('new_logs', pending)
     
     def _get_current_status(self):
         try:
-            # Portas fixas para monitoramento
-            monitored_ports = [22, 80, 443]
-            port_status = {}
+            port_status = self._status_skeleton['ports']
+            now_iso = _cached_now_iso()
+
+            # Invariantes do tick resolvidas uma vez, fora do loop de
+            # portas: a fonte de estatísticas e o set de bloqueadas não
+            # mudam entre as iterações
+            stats_source = getattr(self.detector, 'port_statistics', None)
+            blocked_ports = self.port_manager.blocked_ports
+            rng = self._rng
             
-            for port in monitored_ports:
+            for port in self._MONITORED_PORTS:
                 # Obter estatísticas da porta - usar dados simulados se detector não tiver dados reais
-                if hasattr(self.detector, 'port_statistics') and self.detector.port_statistics:
-                    stats = self.detector.port_statistics.get(port, {})
+                if stats_source:
+                    stats = stats_source.get(port, {})
                 else:
                     # Dados simulados para demonstração
-                    import random
                     if self.attack_active and port == self.attack_target_port:
                         # Durante ataque: muito mais tráfego APENAS na porta alvo
-                        base_packets = random.randint(500, 2000)
-                        unique_ips_count = random.randint(15, 50)
-                        attack_detected = random.choice([True, True, False])  # 66% chance de detectar
+                        base_packets = rng.randint(500, 2000)
+                        unique_ips_count = rng.randint(15, 50)
+                        attack_detected = rng.choice([True, True, False])  # 66% chance de detectar
                     elif self.attack_active and port != self.attack_target_port:
                         # Outras portas durante ataque: tráfego normal baixo, SEM ataque
-                        base_packets = random.randint(5, 25)  # Tráfego normal baixo
-                        unique_ips_count = random.randint(1, 5)  # Poucos IPs únicos
+                        base_packets = rng.randint(5, 25)  # Tráfego normal baixo
+                        unique_ips_count = rng.randint(1, 5)  # Poucos IPs únicos
                         attack_detected = False  # Definitivamente SEM ataque detectado
                     else:
                         # Sem ataque: tráfego zero ou muito baixo
@@ -383,80 +555,89 @@ class DashboardServer:
                         unique_ips_count = 0
                         attack_detected = False
                     
+                    # Só a contagem interessa ao dashboard; gerar um set
+                    # de strings de IP falsas aqui era trabalho jogado fora
                     stats = {
                         'total_packets': base_packets,
-                        'unique_ips': set([f'192.168.1.{i}' for i in random.sample(range(1, min(255, unique_ips_count + 1)), unique_ips_count)]) if unique_ips_count > 0 else set(),
+                        'unique_ips': unique_ips_count,
                         'attack_detected': attack_detected
                     }
                 
                 # Determinar status da porta - verificar se está realmente bloqueada
-                is_blocked = port in self.port_manager.blocked_ports
-                status = 'BLOCKED' if is_blocked else 'ACTIVE'
-                
-                port_status[port] = {
-                    'port': port,
-                    'status': status,
-                    'total_packets': stats.get('total_packets', 0),
-                    'unique_ips': len(stats.get('unique_ips', set())),
-                    'attack_detected': stats.get('attack_detected', False),
-                    'protocol': self._get_port_protocol(port),
-                    'description': self._get_port_description(port),
-                    'last_update': datetime.now().isoformat(),
-                    'is_under_attack': self.attack_active and port == self.attack_target_port and attack_detected
-                }
-            
-            return {
-                'ports': port_status,
-                'system': {
-                    'attack_active': self.attack_active,
-                    'attack_target_port': self.attack_target_port,  # Adicionar porta alvo
-                    'total_blocked_ports': len(self.port_manager.blocked_ports),
-                    'simulation_data': self._prepare_simulation_data(),
-                    'simulation_summary': {
-                        'total_events': len(self.simulation_data['events']),
-                        'attacks': self.simulation_data['attacks'],
-                        'detections': self.simulation_data['detections'],
-                        'blocks': self.simulation_data['blocks']
-                    }
-                },
-                'timestamp': datetime.now().isoformat()
-            }
+                is_blocked = port in blocked_ports
+
+                # Detector real entrega um set de IPs; o caminho simulado
+                # já entrega a contagem pronta
+                unique_ips = stats.get('unique_ips', 0)
+                if not isinstance(unique_ips, int):
+                    unique_ips = len(unique_ips)
+
+                detected = stats.get('attack_detected', False)
+
+                # Campos estáticos (porta, protocolo, descrição) já estão
+                # no esqueleto; só os variáveis são reescritos por tick
+                entry = port_status[port]
+                entry['status'] = 'BLOCKED' if is_blocked else 'ACTIVE'
+                entry['total_packets'] = stats.get('total_packets', 0)
+                entry['unique_ips'] = unique_ips
+                entry['attack_detected'] = detected
+                entry['last_update'] = now_iso
+                entry['is_under_attack'] = (
+                    self.attack_active
+                    and port == self.attack_target_port
+                    and detected
+                )
+
+            status = self._status_skeleton
+            system = status['system']
+            system['attack_active'] = self.attack_active
+            system['attack_target_port'] = self.attack_target_port
+            system['total_blocked_ports'] = len(blocked_ports)
+            system['simulation_data'] = self._prepare_simulation_data()
+            summary = system['simulation_summary']
+            summary['total_events'] = len(self.simulation_data['events'])
+            summary['attacks'] = self.simulation_data['attacks']
+            summary['detections'] = self.simulation_data['detections']
+            summary['blocks'] = self.simulation_data['blocks']
+            status['timestamp'] = now_iso
+            return status
             
         except Exception as e:
             self.logger.error(f"Erro ao obter status: {e}")
             return {'error': str(e)}
     
     def _get_port_protocol(self, port):
-        protocols = {
-            22: 'SSH',
-            80: 'HTTP',
-            443: 'HTTPS'
-        }
-        return protocols.get(port, 'TCP')
-    
+        return self._PROTOCOLS.get(port, 'TCP')
+
     def _get_port_description(self, port):
-        descriptions = {
-            22: 'Secure Shell Protocol',
-            80: 'HyperText Transfer Protocol',
-            443: 'HTTP Secure'
-        }
-        return descriptions.get(port, 'Serviço Desconhecido')
+        return self._DESCRIPTIONS.get(port, 'Serviço Desconhecido')
     
+    # Constantes do tráfego normal simulado, fora do loop de atualização
+    _NORMAL_IPS = ('192.168.1.100', '192.168.1.101', '10.0.0.5')
+    _NORMAL_ACTIVITIES = ('Acesso SSH', 'Requisição HTTP', 'Conexão HTTPS')
+
     def start_background_updates(self):
         def update_loop():
+            # Primeira volta do loop = servidor de fato no ar
+            if self._ready_event is not None:
+                self._ready_event.set()
+
             # Log inicial do sistema
             self._emit_log({
                 'timestamp': datetime.now().isoformat(),
                 'level': 'INFO',
                 'message': '🚀 Sistema de Detecção DDoS iniciado - Monitorando portas 22, 80, 443'
             })
-            
+
+            rng = self._rng
             update_count = 0
             while True:
                 try:
-                    time.sleep(3)  # Atualizar a cada 3 segundos
+                    self.socketio.sleep(3)  # Atualizar a cada 3 segundos
                     update_count += 1
-                    
+
+                    # O isoformat só é calculado nos ramos que realmente
+                    # emitem log, não a cada volta do loop
                     # A cada 20 atualizações (60 segundos), emitir log de status
                     if update_count % 20 == 0 and not self.attack_active:
                         self._emit_log({
@@ -464,27 +645,24 @@ class DashboardServer:
                             'level': 'INFO',
                             'message': f'✅ Sistema ativo - Monitoramento normal | Ciclo {update_count // 20}'
                         })
-                    
+
                     # A cada 10 atualizações (30 segundos), simular tráfego normal
                     if update_count % 10 == 0 and not self.attack_active:
-                        import random
-                        normal_ips = ['192.168.1.100', '192.168.1.101', '10.0.0.5']
-                        normal_ip = random.choice(normal_ips)
-                        port = random.choice([22, 80, 443])
-                        activity = random.choice(['Acesso SSH', 'Requisição HTTP', 'Conexão HTTPS'])
-                        
+                        normal_ip = rng.choice(self._NORMAL_IPS)
+                        port = rng.choice(self._MONITORED_PORTS)
+                        activity = rng.choice(self._NORMAL_ACTIVITIES)
+
                         self._emit_log({
                             'timestamp': datetime.now().isoformat(),
                             'level': 'INFO',
                             'message': f'🌐 Tráfego normal - Porta {port}: {activity} de {normal_ip}'
                         })
-                    
+
                     self._emit_status_update()
                 except Exception as e:
                     self.logger.error(f"Erro no loop de atualização: {e}")
-        
-        update_thread = threading.Thread(target=update_loop, daemon=True)
-        update_thread.start()
+
+        self.socketio.start_background_task(update_loop)
     
     def run(self, host='localhost', port=5000, debug=False):
         try:
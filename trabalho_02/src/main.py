@@ -3,222 +3,83 @@ Sistema Avançado de Detecção DDoS
 
 Sistema integrado para detecção e mitigação de ataques DDoS em tempo real.
 Monitora múltiplas portas, detecta padrões de ataque e aplica bloqueios automatizados.
+
+Modelo de concorrência: três threads — o loop principal (estatísticas,
+dirigido por Event), o detector (sniff bloqueante do Scapy) e o
+dashboard (Flask-SocketIO). As duas bibliotecas centrais são síncronas,
+então as threads dormem em I/O bloqueante e quase não disputam o GIL;
+a sincronização entre elas é toda por Event, sem polling.
 """
 
 import logging
+import os
 import sys
 import time
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread
 
 from utils import load_configuration, setup_logging, validate_configuration, safe_log_message
 from port_manager import PortManager
 from multi_port_detector import MultiPortDetector
 from notification_system import NotificationSystem
-from multi_port_attacker import MultiPortAttacker
 
 
-class DDoSDetectionSystem:
-    """Sistema principal de detecção DDoS."""
-    
-    def __init__(self):
-        self.config = None
-        self.components = {}
-        self.logger = None
-        self.dashboard_thread = None
-        self.detector_thread = None
-
-    def initialize(self):
-        """Inicializa todos os componentes do sistema."""
-        print("🚀 INICIANDO SISTEMA AVANÇADO DE DETECÇÃO DDoS")
-        print("=" * 60)
-        
-        if not self._load_and_validate_config():
-            return False
-        
-        setup_logging()
-        self.logger = logging.getLogger(self.__class__.__name__)
-        
-        self._initialize_components()
-        self._initialize_dashboard()
-        
-        print("✅ Sistema inicializado com sucesso")
-        return True
-
-    def _load_and_validate_config(self):
-        """Carrega e valida arquivo de configuração."""
-        config_paths = ['config.yaml', '../config.yaml']
-        
-        for config_path in config_paths:
-            self.config = load_configuration(config_path)
-            if self.config:
-                break
-        
-        if not self.config:
-            print("❌ Falha ao carregar configurações")
-            return False
-
-        if not validate_configuration(self.config):
-            print("❌ Configuração inválida")
-            return False
-        
-        print("✅ Configurações validadas com sucesso")
-        return True
-
-    def _initialize_components(self):
-        """Inicializa componentes principais do sistema."""
-        self.components['port_manager'] = PortManager(self.config)
-        self.components['notification_system'] = NotificationSystem(self.config)
-        self.components['detector'] = MultiPortDetector(
-            self.config,
-            self.components['port_manager'],
-            self.components['notification_system']
-        )
-        self.components['attacker'] = MultiPortAttacker(self.config)
-        print("🔧 Componentes inicializados")
-
-    def _initialize_dashboard(self):
-        """Inicializa dashboard web se habilitado."""
-        if not self.config['dashboard']['enabled']:
-            print("📊 Dashboard desabilitado")
-            return
-        
+def _pin_to_cpus(cpus):
+    """Fixa a thread atual nas CPUs dadas, quando suportado (Linux)."""
+    if cpus and hasattr(os, 'sched_setaffinity'):
         try:
-            from dashboard import DashboardServer
-            dashboard = DashboardServer(
-                self.components['detector'],
-                self.components['port_manager']
-            )
-            
-            dashboard_port = self.config['dashboard'].get('port', 5000)
-            
-            def run_dashboard():
-                dashboard.run(host='localhost', port=dashboard_port, debug=False)
-            
-            self.dashboard_thread = Thread(target=run_dashboard, daemon=True)
-            self.dashboard_thread.start()
-            print(f"🌐 Dashboard iniciado em http://localhost:{dashboard_port}")
-            time.sleep(2)
-        except ImportError as e:
-            print(f"⚠️ Dashboard não disponível: {e}")
-        except Exception as e:
-            print(f"❌ Erro ao inicializar dashboard: {e}")
-
-    def start_monitoring(self):
-        """Inicia monitoramento de rede em thread separada."""
-        self.detector_thread = Thread(
-            target=self.components['detector'].start_monitoring,
-            daemon=True
-        )
-        self.detector_thread.start()
-        print("🔍 Monitoramento de rede iniciado")
-        time.sleep(3)
-
-    def run_attack_simulation(self, duration=120, intensity='high'):
-        """Executa simulação de ataque DDoS."""
-        self.logger.info(safe_log_message(f"💥 Iniciando simulação de ataque (duração: {duration}s)"))
-        
-        try:
-            self.components['attacker'].run_simulation(
-                duration=duration,
-                attack_intensity=intensity
-            )
-        except KeyboardInterrupt:
-            self.logger.info(safe_log_message("⏹️ Simulação interrompida pelo usuário"))
-
-    def run_monitoring_mode(self):
-        """Executa sistema em modo monitoramento contínuo."""
-        print("🔄 Sistema em modo monitoramento. Pressione Ctrl+C para sair.")
-        
-        try:
-            stats_counter = 0
-            while True:
-                time.sleep(10)
-                stats_counter += 1
-                
-                if stats_counter >= 6:
-                    stats = self.components['detector'].get_statistics()
-                    if stats.get('active_attacks', 0) > 0 or stats.get('total_packets', 0) > 100:
-                        print(f"📊 Atividade: {stats.get('total_packets', 0)} pacotes, {stats.get('active_attacks', 0)} ataques")
-                    stats_counter = 0
-                    
-        except KeyboardInterrupt:
-            print("🛑 Encerrando sistema...")
-
-    def shutdown(self):
-        """Finaliza sistema de forma limpa."""
-        self.logger.info(safe_log_message("🔄 Finalizando sistema..."))
-        print("\n" + "=" * 60)
-        print("✅ SISTEMA FINALIZADO COM SUCESSO")
-
-
-def main():
-    """Função principal da aplicação."""
-    print("🚀 INICIANDO SISTEMA AVANÇADO DE DETECÇÃO DDoS")
-    print("=" * 60)
-    
-    system = DDoSDetectionSystem()
-    
-    if not system.initialize():
-        print("❌ Falha na inicialização do sistema")
-        return 1
-    
-    try:
-        system.start_monitoring()
-        
-        dashboard_port = system.config['dashboard'].get('port', 5000)
-        print(f"🌐 Dashboard disponível em: http://localhost:{dashboard_port}")
-        print("🔍 Sistema de detecção ativo")
-        print("💡 Pressione Ctrl+C para encerrar o sistema")
-        print("=" * 60)
-        
-        system.run_monitoring_mode()
-        
-    except Exception as e:
-        system.logger.error(f"❌ Erro crítico: {e}")
-        return 1
-    finally:
-        system.shutdown()
-    
-    return 0
-
-
-if __name__ == "__main__":
-    exit_code = main()
-    sys.exit(exit_code)
-"""
-Sistema Avançado de Detecção DDoS
-
-Sistema integrado para detecção e mitigação de ataques DDoS em tempo real.
-Monitora múltiplas portas, detecta padrões de ataque e aplica bloqueios automatizados.
-"""
-
-import logging
-import sys
-import time
-from threading import Thread
-
-from utils import load_configuration, setup_logging, validate_configuration, safe_log_message
-from port_manager import PortManager
-from multi_port_detector import MultiPortDetector
-from notification_system import NotificationSystem
-from multi_port_attacker import MultiPortAttacker
+            os.sched_setaffinity(0, set(cpus))
+        except (OSError, ValueError):
+            pass
 
 
 class DDoSDetectionSystem:
     """Sistema principal de detecção DDoS."""
-    
+
+    # Os componentes são um conjunto fixo: atributos com __slots__
+    # substituem o dict components, trocando hash de string por acesso
+    # de offset fixo nos caminhos que os leem
+    __slots__ = (
+        'config', 'logger', 'dashboard_thread', 'detector_thread',
+        'port_manager', 'notification_system', 'detector', 'attacker',
+        'dashboard_enabled', 'dashboard_port',
+        '_stats_event', '_dashboard_ready', '_detector_ready',
+        '_shutdown',
+    )
+
     def __init__(self):
         self.config = None
-        self.components = {}
         self.logger = None
+        self.port_manager = None
+        self.notification_system = None
+        self.detector = None
+        self.attacker = None
+        self.dashboard_enabled = False
+        self.dashboard_port = 5000
         self.dashboard_thread = None
         self.detector_thread = None
+        # Sinalizado pelo detector quando um ataque é detectado, para
+        # que o loop de monitoramento acorde na hora em vez de no tick
+        self._stats_event = Event()
+        # Sinais de prontidão: substituem os sleeps fixos de warmup e
+        # permitem que dashboard e detector aqueçam em paralelo
+        self._dashboard_ready = Event()
+        self._detector_ready = Event()
+        # Pedido de encerramento: interrompe a espera do loop de
+        # monitoramento imediatamente em vez de no próximo timeout
+        self._shutdown = Event()
 
     def initialize(self):
         """Inicializa todos os componentes do sistema."""
-        print("🚀 INICIANDO SISTEMA AVANÇADO DE DETECÇÃO DDoS")
-        print("=" * 60)
-        
+        # Banner em um único write: um syscall em vez de um por print,
+        # o que pesa quando o stdout é um pipe (containers/CI)
+        sys.stdout.write(
+            "🚀 INICIANDO SISTEMA AVANÇADO DE DETECÇÃO DDoS\n"
+            + "=" * 60 + "\n"
+        )
+        sys.stdout.flush()
+
+
         if not self._load_and_validate_config():
             return False
         
@@ -247,65 +108,107 @@ class DDoSDetectionSystem:
         if not validate_configuration(self.config):
             print("❌ Configuração inválida")
             return False
-        
+
+        # Valores imutáveis após a carga viram atributos: cada ponto de
+        # leitura deixa de caminhar o dict do YAML de novo
+        dashboard_config = self.config['dashboard']
+        self.dashboard_enabled = dashboard_config['enabled']
+        self.dashboard_port = dashboard_config.get('port', 5000)
+
         print("✅ Configurações validadas com sucesso")
         return True
 
     def _initialize_components(self):
-        """Inicializa componentes principais do sistema."""
-        self.components['port_manager'] = PortManager(self.config)
-        self.components['notification_system'] = NotificationSystem(self.config)
-        self.components['detector'] = MultiPortDetector(
+        """Inicializa componentes principais do sistema.
+
+        PortManager e NotificationSystem são independentes e podem
+        fazer I/O lento (iptables, SMTP); construir os dois em paralelo
+        limita o custo de inicialização ao mais lento deles. O detector
+        depende de ambos e vem depois; o atacante só é construído (e
+        importado) quando a simulação é de fato executada.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pm_future = executor.submit(PortManager, self.config)
+            ns_future = executor.submit(NotificationSystem, self.config)
+            self.port_manager = pm_future.result()
+            self.notification_system = ns_future.result()
+
+        self.detector = MultiPortDetector(
             self.config,
-            self.components['port_manager'],
-            self.components['notification_system']
+            self.port_manager,
+            self.notification_system,
+            stats_event=self._stats_event,
+            ready=self._detector_ready
         )
-        self.components['attacker'] = MultiPortAttacker(self.config)
         print("🔧 Componentes inicializados")
 
     def _initialize_dashboard(self):
         """Inicializa dashboard web se habilitado."""
-        if not self.config['dashboard']['enabled']:
+        if not self.dashboard_enabled:
             print("📊 Dashboard desabilitado")
             return
         
         try:
             from dashboard import DashboardServer
             dashboard = DashboardServer(
-                self.components['detector'],
-                self.components['port_manager']
+                self.detector,
+                self.port_manager,
+                ready=self._dashboard_ready
             )
-            
-            dashboard_port = self.config['dashboard'].get('port', 5000)
-            
+
+            dashboard_port = self.dashboard_port
+            affinity = self._cpu_affinity('dashboard')
+
             def run_dashboard():
+                _pin_to_cpus(affinity)
                 dashboard.run(host='localhost', port=dashboard_port, debug=False)
-            
+
             self.dashboard_thread = Thread(target=run_dashboard, daemon=True)
             self.dashboard_thread.start()
             print(f"🌐 Dashboard iniciado em http://localhost:{dashboard_port}")
-            time.sleep(2)
+            # A espera acontece em start_monitoring, junto com a do
+            # detector, para que os dois warmups se sobreponham
         except ImportError as e:
             print(f"⚠️ Dashboard não disponível: {e}")
         except Exception as e:
             print(f"❌ Erro ao inicializar dashboard: {e}")
 
+    def _cpu_affinity(self, component):
+        """Lê a lista de CPUs configurada para um componente."""
+        performance = self.config.get('performance') or {}
+        return (performance.get('cpu_affinity') or {}).get(component)
+
     def start_monitoring(self):
         """Inicia monitoramento de rede em thread separada."""
-        self.detector_thread = Thread(
-            target=self.components['detector'].start_monitoring,
-            daemon=True
-        )
+        detector = self.detector
+        affinity = self._cpu_affinity('detector')
+
+        def run_detector():
+            # Detector e dashboard em núcleos separados (se configurado)
+            # evitam disputa de cache entre as duas threads ocupadas
+            _pin_to_cpus(affinity)
+            detector.start_monitoring()
+
+        self.detector_thread = Thread(target=run_detector, daemon=True)
         self.detector_thread.start()
+
+        # Espera por prontidão real em vez de sleeps chutados; os dois
+        # warmups já estão correndo em paralelo neste ponto
+        self._detector_ready.wait(timeout=5)
+        if self.dashboard_thread is not None:
+            self._dashboard_ready.wait(timeout=5)
         print("🔍 Monitoramento de rede iniciado")
-        time.sleep(3)
 
     def run_attack_simulation(self, duration=120, intensity='high'):
         """Executa simulação de ataque DDoS."""
         self.logger.info(safe_log_message(f"💥 Iniciando simulação de ataque (duração: {duration}s)"))
-        
+
+        if self.attacker is None:
+            from multi_port_attacker import MultiPortAttacker
+            self.attacker = MultiPortAttacker(self.config)
+
         try:
-            self.components['attacker'].run_simulation(
+            self.attacker.run_simulation(
                 duration=duration,
                 attack_intensity=intensity
             )
@@ -316,33 +219,40 @@ class DDoSDetectionSystem:
         """Executa sistema em modo monitoramento contínuo."""
         print("🔄 Sistema em modo monitoramento. Pressione Ctrl+C para sair.")
         
+        # Lookups invariantes resolvidos uma vez, fora do loop
+        detector = self.detector
+        stats_event = self._stats_event
+
         try:
-            stats_counter = 0
-            while True:
-                time.sleep(10)
-                stats_counter += 1
-                
-                if stats_counter >= 6:
-                    stats = self.components['detector'].get_statistics()
-                    if stats.get('active_attacks', 0) > 0 or stats.get('total_packets', 0) > 100:
-                        print(f"📊 Atividade: {stats.get('total_packets', 0)} pacotes, {stats.get('active_attacks', 0)} ataques")
-                    stats_counter = 0
-                    
+            while not self._shutdown.is_set():
+                # Bloqueia até o detector sinalizar um ataque ou até o
+                # tick de 60s das estatísticas: sem acordar a cada 10s
+                # só para incrementar um contador
+                fired = stats_event.wait(timeout=60)
+                stats_event.clear()
+
+                stats = detector.get_statistics()
+                pkts = stats.get('total_packets', 0)
+                atks = stats.get('active_attacks', 0)
+                if fired or atks > 0 or pkts > 100:
+                    print(f"📊 Atividade: {pkts} pacotes, {atks} ataques")
+
         except KeyboardInterrupt:
+            self._shutdown.set()
             print("🛑 Encerrando sistema...")
 
     def shutdown(self):
         """Finaliza sistema de forma limpa."""
+        self._shutdown.set()
         self.logger.info(safe_log_message("🔄 Finalizando sistema..."))
-        print("\n" + "=" * 60)
-        print("✅ SISTEMA FINALIZADO COM SUCESSO")
+        sys.stdout.write(
+            "\n" + "=" * 60 + "\n✅ SISTEMA FINALIZADO COM SUCESSO\n"
+        )
+        sys.stdout.flush()
 
 
 def main():
     """Função principal da aplicação."""
-    print("🚀 INICIANDO SISTEMA AVANÇADO DE DETECÇÃO DDoS")
-    print("=" * 60)
-    
     system = DDoSDetectionSystem()
     
     if not system.initialize():
@@ -352,12 +262,15 @@ def main():
     try:
         system.start_monitoring()
         
-        dashboard_port = system.config['dashboard'].get('port', 5000)
-        print(f"🌐 Dashboard disponível em: http://localhost:{dashboard_port}")
-        print("🔍 Sistema de detecção ativo")
-        print("💡 Pressione Ctrl+C para encerrar o sistema")
-        print("=" * 60)
-        
+        sys.stdout.write(
+            f"🌐 Dashboard disponível em: http://localhost:{system.dashboard_port}\n"
+            "🔍 Sistema de detecção ativo\n"
+            "💡 Pressione Ctrl+C para encerrar o sistema\n"
+            + "=" * 60 + "\n"
+        )
+        sys.stdout.flush()
+
+
         system.run_monitoring_mode()
         
     except Exception as e:
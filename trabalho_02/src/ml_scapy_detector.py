@@ -0,0 +1,504 @@
+"""
+Detector DDoS com ML e Captura de Pacotes
+
+Conta pacotes por IP de origem em uma janela deslizante e classifica
+fontes anômalas com IsolationForest. O caminho rápido de captura usa um
+socket AF_PACKET cru e lê apenas o IP de origem do cabeçalho IPv4, sem
+dissecação completa por pacote; o Scapy fica como fallback.
+"""
+
+import logging
+import socket
+import struct
+import threading
+import time
+from collections import defaultdict, deque
+
+try:
+    from scapy.all import sniff, IP
+
+    SCAPY_AVAILABLE = True
+except ImportError:
+    SCAPY_AVAILABLE = False
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from sklearn.ensemble import IsolationForest
+
+    SKLEARN_AVAILABLE = HAS_NUMPY
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+try:
+    from sklearn.linear_model import SGDOneClassSVM
+except ImportError:  # scikit-learn < 1.0
+    SGDOneClassSVM = None
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+TIME_WINDOW = 10  # segundos
+MAX_REQUESTS_PER_IP = 100
+ALERT_TTL = 3600  # segundos até um IP alertado poder alertar de novo
+ALERT_TTL_NS = ALERT_TTL * 1_000_000_000
+
+# Estado do caminho legado (sem numpy), todo com tamanho limitado: a
+# janela de cada IP é um deque com maxlen, as contagens guardam só o
+# valor mais recente por IP e os alertas carregam um timestamp para
+# expirar via TTL — nada cresce sem limite com o tempo de execução
+ip_packet_history = defaultdict(lambda: deque(maxlen=256))
+ip_packet_counts = {}
+ALERTED_IPS = {}  # ip -> instante do último alerta
+
+logger = logging.getLogger(__name__)
+
+# Tabela de slots em arrays contíguos para o caminho AF_PACKET: a
+# janela de cada IP vive em uma linha de timestamps int64 endereçada
+# por sondagem linear sobre o IP como uint32. O kernel observe() faz
+# todo o trabalho por pacote (probe, expiração, inserção, limiar) sem
+# objetos Python; com o Numba presente ele compila para código nativo
+# e roda com nogil.
+N_SLOTS = 1 << 14
+_SLOT_MASK = N_SLOTS - 1
+WINDOW_CAP = 256
+WINDOW_NS = TIME_WINDOW * 1_000_000_000
+
+if HAS_NUMPY:
+    _slot_ts = np.zeros((N_SLOTS, WINDOW_CAP), dtype=np.int64)
+    _slot_head = np.zeros(N_SLOTS, dtype=np.int32)
+    _slot_count = np.zeros(N_SLOTS, dtype=np.int32)
+    _slot_key = np.zeros(N_SLOTS, dtype=np.uint32)
+    _slot_alerted = np.zeros(N_SLOTS, dtype=np.uint8)
+    _slot_alert_ns = np.zeros(N_SLOTS, dtype=np.int64)
+
+    def observe(ip_u32, now_ns, ts, head, count, key, alerted, alert_ns):
+        """Registra um pacote na janela do IP; retorna a contagem se o
+        limiar acabou de ser cruzado, senão 0.
+
+        A sondagem é limitada ao tamanho da tabela e reutiliza no
+        caminho o primeiro slot cuja janela já expirou por inteiro —
+        sob flood de IPs forjados a tabela recicla fontes frias em vez
+        de encher e fazer a sonda girar para sempre. Com todos os slots
+        ativos de verdade, o pacote é descartado (retorna 0).
+        """
+        if ip_u32 == 0:
+            # 0 é o sentinela de slot vazio; 0.0.0.0 nunca é origem
+            # unicast válida, então divide o slot com o broadcast
+            ip_u32 = 0xFFFFFFFF
+
+        slot = ip_u32 & _SLOT_MASK
+        found = -1
+        free = -1
+        for _ in range(N_SLOTS):
+            k = key[slot]
+            if k == ip_u32:
+                found = slot
+                break
+            if k == 0:
+                if free < 0:
+                    free = slot
+                break
+            if free < 0:
+                c = count[slot]
+                if c == 0:
+                    free = slot
+                else:
+                    newest = ts[slot, (head[slot] + c - 1)
+                                & (WINDOW_CAP - 1)]
+                    if now_ns - newest > WINDOW_NS:
+                        free = slot
+            slot = (slot + 1) & _SLOT_MASK
+
+        if found >= 0:
+            slot = found
+        elif free >= 0:
+            slot = free
+            key[slot] = ip_u32
+            head[slot] = 0
+            count[slot] = 0
+            alerted[slot] = 0
+            alert_ns[slot] = 0
+        else:
+            return 0
+
+        h = head[slot]
+        c = count[slot]
+        while c > 0 and now_ns - ts[slot, h] > WINDOW_NS:
+            h = (h + 1) & (WINDOW_CAP - 1)
+            c -= 1
+        if c < WINDOW_CAP:
+            ts[slot, (h + c) & (WINDOW_CAP - 1)] = now_ns
+            c += 1
+        head[slot] = h
+        count[slot] = c
+
+        # Mesma semântica de realerta do caminho legado: depois de
+        # ALERT_TTL uma fonte que volta a atacar alerta de novo
+        if c > MAX_REQUESTS_PER_IP:
+            if alerted[slot] == 0 or now_ns - alert_ns[slot] > ALERT_TTL_NS:
+                alerted[slot] = 1
+                alert_ns[slot] = now_ns
+                return c
+        return 0
+
+    if HAS_NUMBA:
+        observe = njit(cache=True, nogil=True)(observe)
+
+    BATCH = 1024
+
+    def observe_batch(ips, n_ips, now_ns, ts, head, count, key, alerted,
+                      alert_ns, alerts):
+        """Processa um lote de IPs em uma chamada; devolve o número de
+        alertas disparados, com os IPs correspondentes em alerts."""
+        n_alerts = 0
+        for i in range(n_ips):
+            c = observe(ips[i], now_ns, ts, head, count, key, alerted,
+                        alert_ns)
+            if c:
+                alerts[n_alerts] = ips[i]
+                n_alerts += 1
+        return n_alerts
+
+    if HAS_NUMBA:
+        observe_batch = njit(cache=True, nogil=True)(observe_batch)
+
+    def prune_slots(now_ns, ts, head, count, key, alerted, alert_ns):
+        """Poda periódica da tabela de slots, espelho da poda dos
+        dicionários do caminho legado: slots cuja janela inteira já
+        expirou são liberados (a chave volta a 0) e alertas vencidos
+        são limpos para a fonte poder alertar de novo. Um flow
+        deslocado por sondagem pode perder a contagem parcial ao ser
+        liberado — aceitável para a heurística, que reconta na janela
+        seguinte."""
+        for slot in range(N_SLOTS):
+            if key[slot] == 0:
+                continue
+            c = count[slot]
+            if c == 0 or now_ns - ts[
+                slot, (head[slot] + c - 1) & (WINDOW_CAP - 1)
+            ] > WINDOW_NS:
+                key[slot] = 0
+                head[slot] = 0
+                count[slot] = 0
+                alerted[slot] = 0
+                alert_ns[slot] = 0
+            elif alerted[slot] and now_ns - alert_ns[slot] > ALERT_TTL_NS:
+                alerted[slot] = 0
+                alert_ns[slot] = 0
+
+    if HAS_NUMBA:
+        prune_slots = njit(cache=True, nogil=True)(prune_slots)
+
+_IP_STRUCT = struct.Struct("!I")
+
+ETH_P_IP = 0x0800
+_ETH_HLEN = 14
+# Offset do IP de origem dentro do quadro: cabeçalho Ethernet + os 12
+# primeiros bytes do cabeçalho IPv4
+_SRC_IP_OFF = _ETH_HLEN + 12
+
+
+def packet_callback(src_ip):
+    """Processa um pacote capturado a partir do IP de origem."""
+    if HAS_NUMPY:
+        # Mesma tabela de slots do caminho AF_PACKET: a janela vive em
+        # arrays contíguos em vez de um deque de floats por IP, então o
+        # caminho Scapy também para de alocar objetos por pacote
+        (ip_u32,) = _IP_STRUCT.unpack(socket.inet_aton(src_ip))
+        count = observe(
+            ip_u32, time.monotonic_ns(), _slot_ts, _slot_head,
+            _slot_count, _slot_key, _slot_alerted, _slot_alert_ns,
+        )
+        if count:
+            print(
+                f"[ALERTA] 🚨 Limite excedido: {src_ip} "
+                f"({count} pacotes em {TIME_WINDOW}s)"
+            )
+        return
+
+    # Relógio monotônico em ns: inteiros de 64 bits no deque em vez de
+    # floats de wall clock — comparações mais baratas e imunes a saltos
+    # de NTP, que encolheriam ou esticariam a janela
+    now = time.monotonic_ns()
+    history = ip_packet_history[src_ip]
+    history.append(now)
+    while history and now - history[0] > WINDOW_NS:
+        history.popleft()
+
+    count = len(history)
+    ip_packet_counts[src_ip] = count
+
+    if count > MAX_REQUESTS_PER_IP:
+        alerted_at = ALERTED_IPS.get(src_ip)
+        if alerted_at is None or now - alerted_at > ALERT_TTL_NS:
+            ALERTED_IPS[src_ip] = now
+            print(
+                f"[ALERTA] 🚨 Limite excedido: {src_ip} "
+                f"({count} pacotes em {TIME_WINDOW}s)"
+            )
+
+
+def _sniff_af_packet(interface=None):
+    """Loop de captura via socket AF_PACKET cru.
+
+    Cada pacote custa um recv_into em um buffer reutilizado e a leitura
+    de 4 bytes no offset fixo do IP de origem — sem objeto Scapy, sem
+    dissecação de camadas e sem alocação por pacote.
+    """
+    sock = socket.socket(
+        socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_IP)
+    )
+    if interface:
+        sock.bind((interface, 0))
+
+    buf = bytearray(2048)
+    view = memoryview(buf)
+    inet_ntoa = socket.inet_ntoa
+    recv_into = sock.recv_into
+    min_len = _SRC_IP_OFF + 4
+
+    logger.info("📡 Captura via AF_PACKET iniciada")
+
+    if HAS_NUMPY:
+        # Caminho quente em lote: bloqueia pelo primeiro pacote, drena
+        # o que mais chegou sem bloquear e entrega o lote inteiro de
+        # IPs uint32 a uma única chamada do kernel — um frame Python
+        # por lote em vez de um por pacote
+        unpack_ip = _IP_STRUCT.unpack_from
+        monotonic_ns = time.monotonic_ns
+        ips = np.empty(BATCH, dtype=np.uint32)
+        alerts = np.empty(BATCH, dtype=np.uint32)
+        while True:
+            sock.setblocking(True)
+            n = recv_into(buf)
+            n_batch = 0
+            if n >= min_len:
+                ips[0] = unpack_ip(buf, _SRC_IP_OFF)[0]
+                n_batch = 1
+
+            sock.setblocking(False)
+            while n_batch < BATCH:
+                try:
+                    n = recv_into(buf)
+                except BlockingIOError:
+                    break
+                if n >= min_len:
+                    ips[n_batch] = unpack_ip(buf, _SRC_IP_OFF)[0]
+                    n_batch += 1
+
+            if not n_batch:
+                continue
+
+            n_alerts = observe_batch(
+                ips, n_batch, monotonic_ns(), _slot_ts, _slot_head,
+                _slot_count, _slot_key, _slot_alerted, _slot_alert_ns,
+                alerts,
+            )
+            for i in range(n_alerts):
+                src_ip = inet_ntoa(struct.pack("!I", int(alerts[i])))
+                print(
+                    f"[ALERTA] 🚨 Limite excedido: {src_ip} "
+                    f"(> {MAX_REQUESTS_PER_IP} pacotes em {TIME_WINDOW}s)"
+                )
+
+    while True:
+        n = recv_into(buf)
+        if n >= min_len:
+            src_ip = inet_ntoa(view[_SRC_IP_OFF:_SRC_IP_OFF + 4].tobytes())
+            packet_callback(src_ip)
+
+
+def _scapy_callback(packet):
+    if IP in packet:
+        packet_callback(packet[IP].src)
+
+
+def start_packet_sniffing(interface=None):
+    """Inicia a captura de pacotes, preferindo o socket cru ao Scapy."""
+    try:
+        _sniff_af_packet(interface)
+        return
+    except (AttributeError, OSError) as e:
+        logger.warning(f"⚠️ AF_PACKET indisponível ({e}); usando Scapy")
+
+    if SCAPY_AVAILABLE:
+        sniff(prn=_scapy_callback, filter="ip", store=0)
+    else:
+        logger.error("❌ Nenhum mecanismo de captura disponível")
+
+
+def _score_window(model, data):
+    """Classifica uma janela de contagens (-1 = anômalo).
+
+    O modelo incremental absorve a janela via partial_fit — custo
+    constante por amostra — em vez de reconstruir um IsolationForest
+    inteiro a cada TIME_WINDOW; a floresta fica como fallback para
+    versões do scikit-learn sem SGDOneClassSVM.
+    """
+    if model is not None:
+        model.partial_fit(data)
+        return model.predict(data)
+    return IsolationForest(contamination=0.1).fit_predict(data)
+
+
+def run_ml_detection():
+    """Classifica periodicamente os IPs vistos por anomalia."""
+    if not SKLEARN_AVAILABLE:
+        logger.warning("⚠️ scikit-learn indisponível - detecção ML desativada")
+        return
+
+    model = SGDOneClassSVM(nu=0.1) if SGDOneClassSVM is not None else None
+
+    while True:
+        time.sleep(TIME_WINDOW)
+
+        # Caminho AF_PACKET: as contagens já estão no vetor da tabela
+        # de slots; o snapshot para o modelo é uma indexação vetorizada.
+        # A poda espelha a dos dicionários legados: slots frios voltam
+        # a vazios e alertas além do TTL expiram, para a mesma fonte
+        # poder alertar de novo num ataque futuro
+        if HAS_NUMPY:
+            now = time.monotonic_ns()
+            prune_slots(
+                now, _slot_ts, _slot_head, _slot_count, _slot_key,
+                _slot_alerted, _slot_alert_ns,
+            )
+            active = np.nonzero(_slot_key)[0]
+        else:
+            active = ()
+        if len(active) >= 2:
+            data = _slot_count[active].astype(float).reshape(-1, 1)
+            predictions = _score_window(model, data)
+
+            for slot, prediction in zip(active, predictions):
+                if prediction == -1 and not _slot_alerted[slot]:
+                    _slot_alerted[slot] = 1
+                    _slot_alert_ns[slot] = now
+                    ip = socket.inet_ntoa(
+                        struct.pack("!I", int(_slot_key[slot]))
+                    )
+                    print(f"[ALERTA ML] 🤖 Tráfego anômalo detectado de {ip}")
+            continue
+
+        # Poda entradas frias do caminho legado: IPs sem pacotes na
+        # janela atual saem dos dicionários e alertas vencidos expiram,
+        # limitando o estado ao conjunto de fontes ativas
+        now = time.monotonic_ns()
+        for ip in list(ip_packet_history):
+            history = ip_packet_history[ip]
+            if not history or now - history[-1] > WINDOW_NS:
+                del ip_packet_history[ip]
+                ip_packet_counts.pop(ip, None)
+        for ip, alerted_at in list(ALERTED_IPS.items()):
+            if now - alerted_at > ALERT_TTL_NS:
+                del ALERTED_IPS[ip]
+
+        if len(ip_packet_counts) < 2:
+            continue
+
+        ips = list(ip_packet_counts)
+        data = np.fromiter(
+            (ip_packet_counts[ip] for ip in ips), dtype=float, count=len(ips)
+        ).reshape(-1, 1)
+        predictions = _score_window(model, data)
+
+        for ip, prediction in zip(ips, predictions):
+            if prediction == -1 and ip not in ALERTED_IPS:
+                ALERTED_IPS[ip] = now
+                print(f"[ALERTA ML] 🤖 Tráfego anômalo detectado de {ip}")
+
+
+def run_multiprocess(interface=None):
+    """Captura e ML em processos separados sobre memória compartilhada.
+
+    Com threads, o callback de captura e o scoring disputam o mesmo
+    GIL; em processos cada lado tem o seu. A tabela de slots é
+    realocada em SharedMemory e os filhos (fork) herdam as views numpy
+    sobre o mesmo buffer — o processo de ML lê snapshots das contagens
+    sem nenhuma cópia ou fila por pacote.
+    """
+    import multiprocessing as mp
+    from multiprocessing import shared_memory
+
+    global _slot_ts, _slot_head, _slot_count, _slot_key, _slot_alerted, \
+        _slot_alert_ns
+
+    arrays = (_slot_ts, _slot_head, _slot_count, _slot_key, _slot_alerted,
+              _slot_alert_ns)
+    shm = shared_memory.SharedMemory(
+        create=True, size=sum(array.nbytes for array in arrays)
+    )
+    views = []
+    offset = 0
+    for array in arrays:
+        view = np.ndarray(
+            array.shape, dtype=array.dtype, buffer=shm.buf, offset=offset
+        )
+        view[:] = array
+        views.append(view)
+        offset += array.nbytes
+    (_slot_ts, _slot_head, _slot_count, _slot_key, _slot_alerted,
+     _slot_alert_ns) = views
+
+    ctx = mp.get_context("fork")
+    sniffer = ctx.Process(
+        target=start_packet_sniffing, args=(interface,), daemon=True
+    )
+    ml_process = ctx.Process(target=run_ml_detection, daemon=True)
+    sniffer.start()
+    ml_process.start()
+    logger.info("🧩 Captura e ML rodando em processos separados")
+
+    try:
+        sniffer.join()
+    finally:
+        ml_process.terminate()
+        shm.close()
+        shm.unlink()
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Detector DDoS com ML")
+    parser.add_argument("--interface", default=None)
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Roda captura e ML em processos separados (Linux)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    import multiprocessing as mp
+
+    if (
+        args.processes
+        and HAS_NUMPY
+        and "fork" in mp.get_all_start_methods()
+    ):
+        run_multiprocess(args.interface)
+        return
+
+    if args.processes:
+        logger.warning("⚠️ Modo multiprocesso indisponível; usando threads")
+
+    ml_thread = threading.Thread(target=run_ml_detection, daemon=True)
+    ml_thread.start()
+
+    start_packet_sniffing(args.interface)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,17 +5,60 @@ Simula ataques DDoS para testar a eficácia do sistema de detecção.
 """
 
 import logging
+import os
 import random
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from utils import freeze_port_configs
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _attack_worker(config, port, duration, intensity, results):
+    """Executa um ataque em processo filho (alvo picklável)."""
+    attacker = MultiPortAttacker(config)
+    attacker.simulate_ddos_attack(port, duration, intensity)
+    results.put((port, attacker.attack_stats['packets_sent']))
+
+
+def _normal_worker(config, port, duration):
+    """Executa tráfego normal em processo filho (alvo picklável)."""
+    MultiPortAttacker(config).simulate_normal_traffic(port, duration)
 
 
 class MultiPortAttacker:
     """Simulador de ataques DDoS para testes do sistema."""
-    
+
+    # Perfil por intensidade: (intervalo entre pacotes, excedente sobre
+    # max_requests da porta). Tabela resolvida uma vez por ataque no
+    # lugar da cadeia de if/elif
+    _INTENSITY_PROFILES = {
+        'low': (0.1, 20),
+        'medium': (0.05, 50),
+        'high': (0.01, 100),
+    }
+
+    # Conjunto fixo de atributos: sem __dict__ por instância e acesso
+    # por offset nos caminhos de simulação
+    __slots__ = (
+        'config', 'monitored_ports', 'attack_port', 'logger',
+        'attack_stats', '_executor', '_port_cfgs', '_stop_event',
+        '_np_rng', '_jitter', '_jitter_i', '_normal_waits', '_normal_i',
+    )
+
     def __init__(self, config):
         self.config = config
         self.monitored_ports = list(config['detection']['ports'].keys())
+        # Config das portas congelada em dataclasses: leitura por slot
+        # nos loops em vez de três indexações de dict aninhadas
+        self._port_cfgs = freeze_port_configs(config['detection']['ports'])
         self.attack_port = None
         self.logger = logging.getLogger(__name__)
         
@@ -26,132 +69,289 @@ class MultiPortAttacker:
             'normal_traffic_ports': []
         }
 
+        # Pool reutilizado entre simulações: as threads são criadas uma
+        # vez em vez de recriadas a cada run_simulation
+        self._executor = None
+
+        # Pausas via Event.wait em vez de time.sleep: stop() acorda
+        # todas as threads de simulação imediatamente, sem esperar o
+        # próximo timeout
+        self._stop_event = threading.Event()
+
+        # Esperas pré-sorteadas em vetor: indexar um float pronto evita
+        # um sorteio Mersenne-Twister em Python por iteração dos loops
+        # de pacing; os vetores são repreenchidos ao dar a volta
+        if HAS_NUMPY:
+            self._np_rng = np.random.default_rng()
+            self._jitter = self._np_rng.uniform(0.5, 2.0, 4096)
+            self._jitter_i = 0
+            self._normal_waits = self._np_rng.uniform(1.0, 5.0, 4096)
+            self._normal_i = 0
+
+    def _next_jitter(self):
+        """Próxima pausa entre rajadas de ataque (0.5-2s)."""
+        if not HAS_NUMPY:
+            return random.uniform(0.5, 2)
+        i = self._jitter_i
+        self._jitter_i = (i + 1) % len(self._jitter)
+        if self._jitter_i == 0:
+            self._jitter = self._np_rng.uniform(0.5, 2.0, 4096)
+        return float(self._jitter[i])
+
+    def _next_normal_wait(self):
+        """Próxima pausa do tráfego normal (1-5s)."""
+        if not HAS_NUMPY:
+            return random.uniform(1, 5)
+        i = self._normal_i
+        self._normal_i = (i + 1) % len(self._normal_waits)
+        if self._normal_i == 0:
+            self._normal_waits = self._np_rng.uniform(1.0, 5.0, 4096)
+        return float(self._normal_waits[i])
+
     def select_attack_port(self):
         """Seleciona porta aleatória para ataque."""
-        self.attack_port = random.choice(self.monitored_ports)
+        if HAS_NUMPY:
+            self.attack_port = self.monitored_ports[
+                int(self._np_rng.integers(len(self.monitored_ports)))
+            ]
+        else:
+            self.attack_port = random.choice(self.monitored_ports)
         self.attack_stats['target_port'] = self.attack_port
         
-        port_info = self.config['detection']['ports'][self.attack_port]
+        port_info = self._port_cfgs[self.attack_port]
         self.logger.info(
             f"🎯 PORTA SELECIONADA PARA ATAQUE: {self.attack_port} "
-            f"({port_info['protocol']} - {port_info['description']})"
+            f"({port_info.protocol} - {port_info.description})"
         )
         
         return self.attack_port
 
-    def simulate_normal_traffic(self, port, duration=60):
+    def simulate_normal_traffic(self, port, duration=60, barrier=None):
         """Simula tráfego normal em uma porta."""
-        port_info = self.config['detection']['ports'][port]
-        self.logger.info(f"✅ Iniciando tráfego normal na porta {port} ({port_info['protocol']})")
-        
-        start_time = time.time()
+        port_info = self._port_cfgs[port]
+        self.logger.info(f"✅ Iniciando tráfego normal na porta {port} ({port_info.protocol})")
+
+        self._sync_start(barrier)
+
         packet_count = 0
-        
-        while time.time() - start_time < duration:
-            time.sleep(random.uniform(1, 5))
+
+        # Deadline em ns monotônicos computado uma vez: o teste de
+        # parada vira uma comparação de inteiros, imune a ajustes de
+        # relógio, em vez de subtração de floats de wall clock
+        now = time.monotonic_ns
+        stop_wait = self._stop_event.wait
+        debug = self.logger.debug
+        next_wait = self._next_normal_wait
+        deadline = now() + duration * 1_000_000_000
+
+        while now() < deadline:
+            if stop_wait(next_wait()):
+                break
             packet_count += 1
-            
+
             if packet_count % 10 == 0:
-                self.logger.debug(f"✅ Tráfego normal na porta {port}: {packet_count} pacotes")
+                # Formatação adiada: a string só é montada se o nível
+                # DEBUG estiver de fato habilitado
+                debug("✅ Tráfego normal na porta %d: %d pacotes",
+                      port, packet_count)
         
         self.logger.info(f"✅ Tráfego normal finalizado na porta {port}: {packet_count} pacotes")
 
-    def simulate_ddos_attack(self, port, duration=60, intensity='high'):
+    def _sync_start(self, barrier):
+        """Alinha o início das threads de simulação.
+
+        Todas esperam na barreira e partem juntas; um primeiro sleep
+        com jitter individual espalha os inícios dentro de 0.5s, o que
+        a escada de sleeps fixos fazia custando 0.5s por thread.
+        """
+        if barrier is not None:
+            barrier.wait()
+            self._stop_event.wait(random.uniform(0, 0.5))
+
+    def stop(self):
+        """Interrompe a simulação em andamento."""
+        self._stop_event.set()
+
+    def simulate_ddos_attack(self, port, duration=60, intensity='high',
+                             barrier=None):
         """Simula ataque DDoS em uma porta específica."""
-        port_info = self.config['detection']['ports'][port]
-        max_requests = port_info['max_requests']
-        
-        if intensity == 'low':
-            interval = 0.1
-            burst_size = max_requests + 20
-        elif intensity == 'medium':
-            interval = 0.05
-            burst_size = max_requests + 50
-        else:  # high
-            interval = 0.01
-            burst_size = max_requests + 100
-        
+        port_info = self._port_cfgs[port]
+        max_requests = port_info.max_requests
+
+        interval, burst_extra = self._INTENSITY_PROFILES.get(
+            intensity, self._INTENSITY_PROFILES['high']
+        )
+        burst_size = max_requests + burst_extra
+
         self.logger.warning(
             f"💥 INICIANDO ATAQUE DDoS na porta {port} "
-            f"({port_info['protocol']}) - Intensidade: {intensity.upper()}"
+            f"({port_info.protocol}) - Intensidade: {intensity.upper()}"
         )
-        
-        start_time = time.time()
-        self.attack_stats['start_time'] = start_time
+
+        self._sync_start(barrier)
+
+        self.attack_stats['start_time'] = time.time()
         packet_count = 0
-        
-        while time.time() - start_time < duration:
-            for _ in range(burst_size):
-                time.sleep(interval)
-                packet_count += 1
-                self.attack_stats['packets_sent'] = packet_count
-                
-                if packet_count % 100 == 0:
-                    elapsed = time.time() - start_time
-                    rate = packet_count / elapsed
-                    self.logger.warning(
-                        f"🔥 Ataque em andamento na porta {port}: "
-                        f"{packet_count} pacotes ({rate:.1f} pps)"
-                    )
-            
-            time.sleep(random.uniform(0.5, 2))
+
+        # Um sleep por rajada em vez de um por pacote: o custo do timer
+        # é amortizado sobre burst_size pacotes e a contagem avança em
+        # bloco, mantendo a mesma taxa simulada. Invariantes do loop
+        # resolvidos para locais uma única vez; a duração é um deadline
+        # em ns monotônicos, comparação de inteiros sem wall clock
+        burst_time = interval * burst_size
+        stop_wait = self._stop_event.wait
+        now = time.monotonic_ns
+        warn = self.logger.warning
+        stats = self.attack_stats
+        next_jitter = self._next_jitter
+        start_ns = now()
+        deadline = start_ns + duration * 1_000_000_000
+
+        while now() < deadline:
+            if stop_wait(burst_time):
+                break
+            prev_count = packet_count
+            packet_count += burst_size
+            stats['packets_sent'] = packet_count
+
+            # Progresso apenas ao cruzar um múltiplo de 100 pacotes, em
+            # vez de uma linha por rajada
+            if packet_count // 100 != prev_count // 100:
+                rate = packet_count * 1e9 / (now() - start_ns)
+                warn("🔥 Ataque em andamento na porta %d: "
+                     "%d pacotes (%.1f pps)", port, packet_count, rate)
+
+            if stop_wait(next_jitter()):
+                break
         
         self.logger.warning(
             f"💥 ATAQUE FINALIZADO na porta {port}: "
             f"{packet_count} pacotes enviados em {duration}s"
         )
 
-    def run_simulation(self, duration=120, attack_intensity='high'):
-        """Executa simulação completa de ataque multi-porta."""
+    def run_simulation(self, duration=120, attack_intensity='high',
+                       use_processes=False):
+        """Executa simulação completa de ataque multi-porta.
+
+        Com use_processes=True cada simulador roda em um processo
+        próprio, fora do GIL deste interpretador — útil quando a
+        captura real compete pelo mesmo processo. O padrão continua
+        sendo threads: os simuladores passam a vida dormindo, então em
+        geral não disputam o GIL.
+        """
         self.logger.info("🚀 INICIANDO SIMULAÇÃO MULTI-PORTA")
-        
+
         attack_port = self.select_attack_port()
         normal_ports = [p for p in self.monitored_ports if p != attack_port]
         self.attack_stats['normal_traffic_ports'] = normal_ports
-        
+
         self.logger.info(f"📋 Portas com tráfego normal: {normal_ports}")
         self.logger.info(f"⚡ Duração da simulação: {duration} segundos")
-        
-        threads = []
-        
-        attack_thread = threading.Thread(
-            target=self.simulate_ddos_attack,
-            args=(attack_port, duration, attack_intensity),
-            name=f"Attack-Port-{attack_port}"
-        )
-        threads.append(attack_thread)
-        
+
+        if use_processes:
+            self._run_simulation_processes(
+                attack_port, normal_ports, duration, attack_intensity
+            )
+            self.logger.info("✅ SIMULAÇÃO FINALIZADA")
+            self._print_attack_summary()
+            return
+
+        self._stop_event.clear()
+
+        # Pool limitado a 2x os núcleos: com muitas portas monitoradas
+        # as simulações excedentes esperam na fila do executor em vez
+        # de virar threads extras disputando o GIL
+        workers = min(len(self.monitored_ports), (os.cpu_count() or 1) * 2)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix='Simulation'
+            )
+
+        # Barreira no lugar da escada de sleep(0.5) por thread: todas
+        # partem juntas assim que a última chega, e o espalhamento fica
+        # por conta do jitter individual em _sync_start. Só vale quando
+        # o pool comporta todas de uma vez; com tarefas enfileiradas a
+        # barreira nunca completaria
+        parties = 1 + len(normal_ports)
+        barrier = threading.Barrier(parties) if workers >= parties else None
+
+        futures = [
+            self._executor.submit(
+                self.simulate_ddos_attack,
+                attack_port, duration, attack_intensity, barrier
+            )
+        ]
         for port in normal_ports:
-            normal_thread = threading.Thread(
-                target=self.simulate_normal_traffic,
-                args=(port, duration),
-                name=f"Normal-Port-{port}"
+            futures.append(
+                self._executor.submit(
+                    self.simulate_normal_traffic, port, duration, barrier
+                )
             )
-            threads.append(normal_thread)
-        
-        for thread in threads:
-            thread.start()
-            time.sleep(0.5)
-        
-        self.logger.info(f"🔄 {len(threads)} threads de simulação iniciadas")
-        
-        for thread in threads:
-            thread.join()
-        
+
+        self.logger.info(f"🔄 {len(futures)} threads de simulação iniciadas")
+
+        wait(futures)
+        for future in futures:
+            future.result()
+
         self.logger.info("✅ SIMULAÇÃO FINALIZADA")
         self._print_attack_summary()
 
+    def _run_simulation_processes(self, attack_port, normal_ports,
+                                  duration, intensity):
+        """Roda os simuladores em processos; coleta os contadores
+        finais por uma Queue, já que os filhos não compartilham
+        attack_stats."""
+        import multiprocessing as mp
+
+        ctx = mp.get_context()
+        results = ctx.Queue()
+
+        processes = [
+            ctx.Process(
+                target=_attack_worker,
+                args=(self.config, attack_port, duration, intensity,
+                      results),
+            )
+        ]
+        for port in normal_ports:
+            processes.append(
+                ctx.Process(
+                    target=_normal_worker,
+                    args=(self.config, port, duration),
+                )
+            )
+
+        self.attack_stats['start_time'] = time.time()
+        for process in processes:
+            process.start()
+
+        self.logger.info(
+            f"🔄 {len(processes)} processos de simulação iniciados"
+        )
+
+        for process in processes:
+            process.join()
+
+        while not results.empty():
+            port, packets_sent = results.get()
+            if port == attack_port:
+                self.attack_stats['packets_sent'] = packets_sent
+
+    _SEP = "=" * 50
+
     def _print_attack_summary(self):
         """Exibe resumo da simulação executada."""
         if self.attack_stats['start_time']:
             duration = time.time() - self.attack_stats['start_time']
-            
-            print("\n" + "="*50)
+
+            print("\n" + self._SEP)
             print("📊 RESUMO DA SIMULAÇÃO")
-            print("="*50)
+            print(self._SEP)
             print(f"🎯 Porta atacada: {self.attack_stats['target_port']}")
             print(f"📋 Portas normais: {self.attack_stats['normal_traffic_ports']}")
             print(f"📦 Pacotes enviados: {self.attack_stats['packets_sent']}")
             print(f"⏱️ Duração: {duration:.1f}s")
             print(f"📈 Taxa média: {self.attack_stats['packets_sent']/duration:.1f} pps")
-            print("="*50 + "\n")
+            print(self._SEP + "\n")
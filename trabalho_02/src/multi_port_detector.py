@@ -6,11 +6,14 @@ simultaneamente e identifica padrões de tráfego suspeitos.
 """
 
 import logging
+import socket
+import struct
 import time
 from collections import defaultdict, deque
 from datetime import datetime
+from threading import Event, Thread
 
-from utils import safe_log_message
+from utils import freeze_port_configs, safe_log_message
 
 try:
     from scapy.all import sniff, IP, TCP, UDP, conf
@@ -19,19 +22,151 @@ except ImportError:
     SCAPY_AVAILABLE = False
     print("⚠️ Scapy não disponível - Modo simulação ativado")
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+if HAS_NUMPY and HAS_NUMBA:
+    @njit(cache=True)
+    def _aggregate_counters(pkts, atks):
+        """Soma os contadores por porta em código nativo."""
+        return pkts.sum(), (atks > 0).sum()
+elif HAS_NUMPY:
+    def _aggregate_counters(pkts, atks):
+        return pkts.sum(), (atks > 0).sum()
+
+if HAS_NUMPY:
+    # Capacidade do anel de timestamps de cada fluxo (porta, IP)
+    WINDOW_CAP = 256
+
+    def _observe_flow(ts, head, tail, cap, now_ns, window_ns):
+        """Registra um pacote no anel do fluxo e expira os antigos.
+
+        Todo o trabalho por pacote — inserção, saturação e avanço da
+        cauda pela janela — é aritmética de inteiros sobre um array
+        contíguo; com o Numba presente compila para nativo e roda com
+        nogil, sem travar as outras threads durante a captura.
+        """
+        ts[head % cap] = now_ns
+        head += 1
+        if head - tail > cap:
+            tail = head - cap
+        while tail < head and now_ns - ts[tail % cap] > window_ns:
+            tail += 1
+        return head, tail
+
+    if HAS_NUMBA:
+        _observe_flow = njit(cache=True, nogil=True)(_observe_flow)
+
+    class _FlowState:
+        """Janela deslizante de um fluxo (porta, IP) em anel numpy."""
+
+        __slots__ = ('ts', 'head', 'tail')
+
+        def __init__(self, cap=WINDOW_CAP):
+            self.ts = np.empty(cap, dtype=np.int64)
+            self.head = 0
+            self.tail = 0
+
+
+ETH_P_IP = 0x0800
+SO_ATTACH_FILTER = 26
+_IP_STRUCT = struct.Struct("!I")
+
+# Marcador de fluxo em whitelist: a decisão é tomada no primeiro pacote
+# e fica cacheada no próprio dict de fluxos
+_WHITELISTED = object()
+
+
+def _build_cbpf(ports):
+    """Monta um programa BPF clássico: IPv4, TCP/UDP não fragmentado,
+    porta de destino em `ports`. Tudo fora disso é descartado no kernel
+    antes de chegar ao Python."""
+    insns = []
+    n = len(ports)
+    accept = 9 + n
+    drop = accept + 1
+
+    def off(target, cur):
+        return target - cur - 1
+
+    insns.append((0x28, 0, 0, 12))                   # ldh ethertype
+    insns.append((0x15, 0, off(drop, 1), ETH_P_IP))  # jeq IPv4
+    insns.append((0x30, 0, 0, 23))                   # ldb protocolo IP
+    insns.append((0x15, 1, 0, 6))                    # jeq TCP
+    insns.append((0x15, 0, off(drop, 4), 17))        # jeq UDP
+    insns.append((0x28, 0, 0, 20))                   # ldh flags/frag
+    insns.append((0x45, off(drop, 6), 0, 0x1fff))    # jset fragmento
+    insns.append((0xb1, 0, 0, 14))                   # ldxb 4*([14]&0xf)
+    insns.append((0x48, 0, 0, 16))                   # ldh [x+16] dst port
+    for i, port in enumerate(ports):
+        cur = 9 + i
+        jf = 0 if i < n - 1 else off(drop, cur)
+        insns.append((0x15, off(accept, cur), jf, port))
+    insns.append((0x06, 0, 0, 0x40000))              # aceita
+    insns.append((0x06, 0, 0, 0))                    # descarta
+    return insns
+
+
+def _attach_bpf(sock, ports):
+    """Anexa o filtro BPF ao socket; retorna o buffer, que precisa
+    continuar vivo enquanto o socket existir."""
+    import ctypes
+
+    insns = _build_cbpf(sorted(ports))
+    prog = b"".join(struct.pack("HBBI", *insn) for insn in insns)
+    buf = ctypes.create_string_buffer(prog, len(prog))
+    fprog = struct.pack("HL", len(insns), ctypes.addressof(buf))
+    sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, fprog)
+    return buf
+
 
 class MultiPortDetector:
     """Detector de ataques DDoS multi-porta."""
     
-    def __init__(self, config, port_manager, notification_system):
+    def __init__(self, config, port_manager, notification_system,
+                 stats_event=None, ready=None):
         self.config = config
         self.port_manager = port_manager
         self.notification_system = notification_system
+        # Event opcional sinalizado a cada detecção, para acordar o
+        # loop de estatísticas do sistema principal sob demanda
+        self.stats_event = stats_event
+        # Event opcional de prontidão, sinalizado quando o monitoramento
+        # efetivamente começa (substitui sleeps fixos de warmup)
+        self.ready = ready
         
         self.time_window = config['detection']['time_window']
         self.monitored_ports = config['detection']['ports']
+        # Config das portas congelada em dataclasses: os caminhos por
+        # pacote leem atributos por slot em vez de dicts aninhados
+        self._port_cfgs = freeze_port_configs(self.monitored_ports)
+        # Limiar por porta em dict plano int->int: o compare por pacote
+        # faz um hash de int, sem carregar o dataclass e o atributo
+        self._port_max = {
+            port: cfg.max_requests for port, cfg in self._port_cfgs.items()
+        }
         
-        self.port_ip_history = defaultdict(lambda: defaultdict(deque))
+        # Janela por fluxo: anel numpy consumido pelo kernel compilado
+        # quando há numpy; deques puras como fallback. O anel de cada
+        # porta tem max_requests + 1 posições — o suficiente para o
+        # limiar disparar, sem guardar timestamps além do necessário.
+        # Os fluxos vivem em um único dict plano com chave inteira
+        # (porta << 32) | IP: um hash de int por pacote em vez de dois
+        # hashes (porta e string de IP) em dicts aninhados
+        self._window_ns = self.time_window * 1_000_000_000
+        if HAS_NUMPY:
+            self._flows = {}
+        else:
+            self.port_ip_history = defaultdict(lambda: defaultdict(deque))
         self.port_statistics = defaultdict(lambda: {
             'total_packets': 0,
             'unique_ips': set(),
@@ -41,6 +176,33 @@ class MultiPortDetector:
         })
         
         self.port_status = {}
+
+        # Encerramento dos auxiliares (reporter de status)
+        self._stop_event = Event()
+
+        # Filtro BPF montado uma vez na construção: o libpcap compila a
+        # expressão para o kernel, então quanto mais cedo ela descarta
+        # (só IPv4 TCP/UDP nas portas monitoradas), menos pacotes
+        # atravessam a fronteira kernel→Python
+        self._bpf_filter = "ip and (tcp or udp) and ({})".format(
+            " or ".join(f"port {port}" for port in self.monitored_ports)
+        )
+
+        # Contadores agregados em SoA: dois vetores int64 indexados por
+        # slot de porta, somados por kernel nativo em get_statistics em
+        # vez de varrer os dicts por porta a cada leitura
+        if HAS_NUMPY:
+            self._port_slots = {
+                port: slot
+                for slot, port in enumerate(self.monitored_ports)
+            }
+            self._pkts = np.zeros(len(self._port_slots), dtype=np.int64)
+            self._atks = np.zeros(len(self._port_slots), dtype=np.int64)
+            # Aquece o JIT fora do caminho quente
+            _aggregate_counters(self._pkts, self._atks)
+            warmup = _FlowState()
+            _observe_flow(warmup.ts, 0, 0, len(warmup.ts), 0, 0)
+
         self.logger = logging.getLogger(self.__class__.__name__)
         
         self.logger.info(f"Detector inicializado para portas: {list(self.monitored_ports.keys())}")
@@ -59,16 +221,50 @@ class MultiPortDetector:
 
     def _process_packet(self, source_ip, destination_port):
         """Analisa pacote individual."""
-        current_time = time.time()
-        
+        if HAS_NUMPY:
+            (ip_u32,) = _IP_STRUCT.unpack(socket.inet_aton(source_ip))
+            self._process_flow(ip_u32, destination_port)
+            return
+
         if self.port_manager.is_whitelisted(source_ip):
             return
-        
+
+        current_time = time.time()
         self.port_ip_history[destination_port][source_ip].append(current_time)
         self._cleanup_old_timestamps(destination_port, source_ip, current_time)
         self._update_port_statistics(destination_port, source_ip)
         self._check_for_ddos_attack(source_ip, destination_port, current_time)
 
+    def _process_flow(self, ip_u32, port):
+        """Caminho quente por pacote, com o IP já como inteiro.
+
+        Conversão para string e consulta à whitelist acontecem só no
+        primeiro pacote do fluxo; a decisão fica cacheada na entrada do
+        dict. Do segundo pacote em diante o custo é um hash de int, a
+        chamada do kernel e o compare do limiar.
+        """
+        key = (port << 32) | ip_u32
+        flow = self._flows.get(key)
+        if flow is None:
+            src_ip = socket.inet_ntoa(_IP_STRUCT.pack(ip_u32))
+            if self.port_manager.is_whitelisted(src_ip):
+                self._flows[key] = _WHITELISTED
+                return
+            flow = _FlowState(self._port_max[port] + 1)
+            self._flows[key] = flow
+        elif flow is _WHITELISTED:
+            return
+
+        flow.head, flow.tail = _observe_flow(
+            flow.ts, flow.head, flow.tail, len(flow.ts),
+            time.monotonic_ns(), self._window_ns
+        )
+        self._update_port_statistics(port, ip_u32)
+        count = flow.head - flow.tail
+        if count > self._port_max[port]:
+            src_ip = socket.inet_ntoa(_IP_STRUCT.pack(ip_u32))
+            self._handle_ddos_attack(src_ip, port, count)
+
     def _cleanup_old_timestamps(self, port, ip, current_time):
         """Remove timestamps antigos."""
         while (self.port_ip_history[port][ip] and 
@@ -78,7 +274,7 @@ class MultiPortDetector:
     def _check_for_ddos_attack(self, source_ip, port, current_time):
         """Verifica se padrão indica ataque DDoS."""
         packet_count = len(self.port_ip_history[port][source_ip])
-        max_allowed = self.monitored_ports[port]['max_requests']
+        max_allowed = self._port_max[port]
         
         if packet_count > max_allowed:
             self._handle_ddos_attack(source_ip, port, packet_count)
@@ -88,55 +284,80 @@ class MultiPortDetector:
         stats = self.port_statistics[port]
         stats['total_packets'] += 1
         stats['unique_ips'].add(source_ip)
+
+        if HAS_NUMPY:
+            self._pkts[self._port_slots[port]] += 1
         
         if stats['first_packet_time'] is None:
             stats['first_packet_time'] = time.time()
-        
-        self._update_port_status(port)
+
+    def _reporter_loop(self):
+        """Reconstrói o status por porta para o dashboard a ~1 Hz.
+
+        O dict de status, o datetime.now().isoformat() e o len() de
+        unique_ips saem do caminho por pacote: o dashboard lê no máximo
+        a cada segundo, então formatar mais rápido que isso é custo
+        puro na thread de captura.
+        """
+        stop_wait = self._stop_event.wait
+        while not stop_wait(1.0):
+            for port in list(self.port_statistics):
+                self._update_port_status(port)
 
     def _update_port_status(self, port):
         """Atualiza status para dashboard."""
         stats = self.port_statistics[port]
-        config_port = self.monitored_ports[port]
-        
+        config_port = self._port_cfgs[port]
+
         self.port_status[port] = {
             'port': port,
-            'protocol': config_port['protocol'],
-            'description': config_port['description'],
+            'protocol': config_port.protocol,
+            'description': config_port.description,
             'status': 'BLOCKED' if port in self.port_manager.blocked_ports else 'ACTIVE',
             'total_packets': stats['total_packets'],
             'unique_ips': len(stats['unique_ips']),
             'attack_detected': stats['attack_detected'],
             'last_update': datetime.now().isoformat(),
-            'critical': config_port['critical']
+            'critical': config_port.critical
         }
 
     def _handle_ddos_attack(self, src_ip, dst_port, packet_count):
         """Processa detecção de ataque DDoS."""
-        port_config = self.monitored_ports[dst_port]
-        
+        port_config = self._port_cfgs[dst_port]
+
         self.port_statistics[dst_port]['attack_detected'] = True
         self.port_statistics[dst_port]['last_attack'] = time.time()
-        
-        self.logger.warning(
-            f"🚨 ATAQUE DDoS DETECTADO! "
-            f"IP: {src_ip} | Porta: {dst_port} ({port_config['protocol']}) | "
-            f"Pacotes: {packet_count} | Limite: {port_config['max_requests']}"
-        )
-        
+
+        if HAS_NUMPY:
+            self._atks[self._port_slots[dst_port]] = 1
+
+        # Argumentos %-style adiados: este log dispara por pacote acima
+        # do limiar, então a string só deve ser montada se WARNING
+        # estiver habilitado
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(
+                "🚨 ATAQUE DDoS DETECTADO! "
+                "IP: %s | Porta: %d (%s) | Pacotes: %d | Limite: %d",
+                src_ip, dst_port, port_config.protocol,
+                packet_count, port_config.max_requests
+            )
+
         attack_data = {
             'ip': src_ip,
             'port': dst_port,
-            'protocol': port_config['protocol'],
-            'description': port_config['description'],
+            'protocol': port_config.protocol,
+            'description': port_config.description,
             'packet_count': packet_count,
-            'max_allowed': port_config['max_requests'],
+            'max_allowed': port_config.max_requests,
             'timestamp': datetime.now().isoformat(),
-            'critical': port_config['critical']
+            'critical': port_config.critical
         }
         
         self.notification_system.send_alert(attack_data)
-        
+
+        if self.stats_event is not None:
+            self.stats_event.set()
+
         if dst_port not in self.port_manager.blocked_ports:
             self.port_manager.block_port(dst_port)
         
@@ -145,7 +366,24 @@ class MultiPortDetector:
     def start_monitoring(self):
         """Inicia monitoramento de pacotes."""
         self.logger.info(f"Iniciando monitoramento de portas: {list(self.monitored_ports.keys())}")
-        
+
+        if self.ready is not None:
+            self.ready.set()
+
+        Thread(target=self._reporter_loop, daemon=True).start()
+
+        # Caminho preferido: socket AF_PACKET com o filtro BPF anexado
+        # via SO_ATTACH_FILTER — pacotes fora das portas monitoradas
+        # morrem no kernel e os aceitos são lidos em offsets fixos, sem
+        # dissecação do Scapy
+        try:
+            self._sniff_af_packet()
+            return
+        except (AttributeError, OSError) as e:
+            self.logger.warning(
+                f"⚠️ AF_PACKET indisponível ({e}); usando Scapy"
+            )
+
         if not SCAPY_AVAILABLE:
             self.logger.warning("Scapy não disponível - Iniciando modo simulação")
             self._start_simulation_mode()
@@ -167,6 +405,63 @@ class MultiPortDetector:
             self.logger.warning("Continuando em modo simulação...")
             self._start_simulation_mode()
 
+    def _sniff_af_packet(self):
+        """Loop de captura via socket cru com filtro BPF no kernel."""
+        sock = socket.socket(
+            socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_IP)
+        )
+        self._bpf_buf = _attach_bpf(sock, list(self.monitored_ports))
+        # Buffer de recepção largo: segura a rajada no kernel enquanto
+        # a thread de captura espera sua vez no GIL
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+
+        buf = bytearray(2048)
+        recv_into = sock.recv_into
+        monitored = self.monitored_ports
+
+        # Com numpy o IP segue como inteiro direto do quadro, sem passar
+        # por string; o fallback converte para o caminho com deques
+        if HAS_NUMPY:
+            _flow = self._process_flow
+            _from_bytes = int.from_bytes
+
+            def process(raw_ip, port):
+                _flow(_from_bytes(raw_ip, 'big'), port)
+        else:
+            _packet = self._process_packet
+            _ntoa = socket.inet_ntoa
+
+            def process(raw_ip, port):
+                _packet(_ntoa(raw_ip), port)
+
+        self.logger.info("📡 Captura AF_PACKET com filtro BPF no kernel")
+
+        # Drenagem em rajada: bloqueia só pelo primeiro pacote e esvazia
+        # o backlog do socket com leituras MSG_DONTWAIT, até 256 por
+        # rodada — uma espera amortizada sobre a rajada inteira, que é
+        # exatamente o perfil de chegada durante um flood
+        dontwait = socket.MSG_DONTWAIT
+
+        while True:
+            n = recv_into(buf)
+            budget = 256
+            while True:
+                if n >= 34:
+                    # IP de origem no offset fixo 26; porta de destino
+                    # depois do cabeçalho IP, cujo tamanho vem do IHL
+                    l4_off = 14 + (buf[14] & 0x0F) * 4
+                    if n >= l4_off + 4:
+                        dst_port = (buf[l4_off + 2] << 8) | buf[l4_off + 3]
+                        if dst_port in monitored:
+                            process(bytes(buf[26:30]), dst_port)
+                budget -= 1
+                if not budget:
+                    break
+                try:
+                    n = recv_into(buf, 2048, dontwait)
+                except BlockingIOError:
+                    break
+
     def _configure_scapy_compatibility(self):
         """Configura Scapy para compatibilidade."""
         if SCAPY_AVAILABLE:
@@ -177,18 +472,33 @@ class MultiPortDetector:
                 pass
 
     def _create_packet_filter(self):
-        """Cria filtro BPF para portas monitoradas."""
-        port_filters = [f"port {port}" for port in self.monitored_ports.keys()]
-        return " or ".join(port_filters)
+        """Retorna o filtro BPF pré-montado das portas monitoradas."""
+        return self._bpf_filter
+
+    def stop(self):
+        """Encerra o reporter e o modo simulação."""
+        self._stop_event.set()
 
     def _start_simulation_mode(self):
         """Modo simulação quando Scapy não disponível."""
         self.logger.info("Modo simulação ativado - Detector funcionando sem captura real")
-        while True:
-            time.sleep(1)
+        # Bloqueia até stop(): a thread nunca é escalonada em vão, em
+        # vez de acordar a cada segundo só para dormir de novo
+        self._stop_event.wait()
 
     def get_statistics(self):
         """Retorna estatísticas atuais do sistema."""
+        if HAS_NUMPY:
+            total_packets, active_attacks = _aggregate_counters(
+                self._pkts, self._atks
+            )
+            return {
+                'port_status': self.port_status,
+                'total_monitored_ports': len(self.monitored_ports),
+                'active_attacks': int(active_attacks),
+                'total_packets': int(total_packets)
+            }
+
         return {
             'port_status': self.port_status,
             'total_monitored_ports': len(self.monitored_ports),
@@ -2,9 +2,38 @@ import logging
 import os
 import re
 import yaml
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True, slots=True)
+class PortConfig:
+    """Configuração imutável de uma porta monitorada.
+
+    Atributos lidos nos caminhos por pacote/por iteração: acesso por
+    slot em vez da cadeia config['detection']['ports'][port][campo].
+    """
+    port: int
+    protocol: str
+    description: str
+    max_requests: int
+    critical: bool
+
+
+def freeze_port_configs(ports):
+    """Converte o dict de portas do YAML em PortConfig por porta."""
+    return {
+        int(port): PortConfig(
+            port=int(port),
+            protocol=cfg['protocol'],
+            description=cfg['description'],
+            max_requests=cfg['max_requests'],
+            critical=cfg.get('critical', False),
+        )
+        for port, cfg in ports.items()
+    }
+
+
 def load_configuration(config_file='config.yaml'):
     try:
         config_path = Path(config_file)
@@ -26,8 +55,11 @@ def load_configuration(config_file='config.yaml'):
 
 
 def setup_logging(log_file='logs/ddos_system.log', level=logging.INFO):
+    import atexit
+    import queue
     import sys
-    
+    from logging.handlers import QueueHandler, QueueListener
+
     log_dir = os.path.dirname(log_file)
     if log_dir and not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -59,11 +91,22 @@ def setup_logging(log_file='logs/ddos_system.log', level=logging.INFO):
         datefmt='%Y-%m-%d %H:%M:%S'
     ))
     
+    # Handlers reais atrás de uma fila: a thread que loga só enfileira
+    # o LogRecord (put_nowait) e volta para o loop; formatação e I/O de
+    # arquivo/console acontecem na thread do QueueListener, fora dos
+    # caminhos quentes de captura e simulação
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     root_logger.handlers.clear()
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
 
 def validate_configuration(config):